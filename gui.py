@@ -1,19 +1,114 @@
 import customtkinter as ctk
 import tkinter as tk
-from typing import Callable, List, Dict, Any, Optional, Tuple
-import time
-from PIL import Image, ImageTk
+from tkinter import ttk
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 import os
 from quiz_logic import QuizLogic
 from high_scores import HighScores
 from localization import Localization
 
 
+# Row background and rank icon for the top three high scores
+MEDAL_BG: Dict[int, str] = {1: "#FFD700", 2: "#C0C0C0", 3: "#CD7F32"}
+MEDAL_ICON: Dict[int, str] = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
+# An unlockable achievement, keyed in QuizApp.achievements by id
+Achievement = namedtuple("Achievement", "id title description icon")
+
+# Every achievement that can be unlocked, in display order
+ALL_ACHIEVEMENTS: Tuple[Achievement, ...] = (
+    Achievement("perfect_easy", "Perfect Easy Quiz",
+                "Complete an easy quiz with 100% accuracy", "🎯"),
+    Achievement("perfect_medium", "Perfect Medium Quiz",
+                "Complete a medium difficulty quiz with 100% accuracy", "🎯"),
+    Achievement("perfect_hard", "Perfect Hard Quiz",
+                "Complete a hard quiz with 100% accuracy", "🎯"),
+    Achievement("streak_5", "Hot Streak",
+                "Answer 5 questions correctly in a row", "🔥"),
+    Achievement("streak_10", "On Fire!",
+                "Answer 10 questions correctly in a row", "🔥"),
+    Achievement("score_100", "Century",
+                "Earn 100 points in a single quiz", "💯"),
+    Achievement("score_200", "Double Century",
+                "Earn 200 points in a single quiz", "🌟"),
+    Achievement("all_categories", "Jack of All Trades",
+                "Complete quizzes in all categories", "🧠"),
+)
+
+
+@contextmanager
+def _batched(widget: tk.Misc, **pack_options: Any) -> Iterator[tk.Misc]:
+    """
+    Keep a container out of its parent's layout while it is being filled.
+
+    The widget is unpacked for the duration of the block and packed again
+    with the given options afterwards, so its children are laid out in a
+    single pass instead of one geometry update per child.
+
+    Args:
+        widget: Container to fill
+        **pack_options: Options passed to pack() when re-attaching
+
+    Yields:
+        The container
+    """
+    widget.pack_forget()
+    try:
+        yield widget
+    finally:
+        widget.pack(**pack_options)
+
+
+class _Palette:
+    """
+    Fixed set of named colors used throughout the GUI.
+
+    Uses __slots__ so every color is a plain attribute read rather than
+    a string-keyed dictionary lookup.
+    """
+
+    __slots__ = (
+        "primary", "secondary", "accent", "correct", "incorrect",
+        "highlight", "text_light", "text_dark", "background"
+    )
+
+    def __init__(self, **colors: str):
+        """
+        Initialize the palette.
+
+        Args:
+            **colors: Hex color string for every slot name
+        """
+        for name in self.__slots__:
+            setattr(self, name, colors[name])
+
+
 class QuizApp:
     """
     Main application class for the Quiz Game GUI using CustomTkinter.
     """
 
+    # Font roles shared by the screens, as (base size, weight, slant)
+    FONT_SPECS: Dict[str, Tuple[int, str, str]] = {
+        "h1": (38, "bold", "roman"),
+        "h2": (22, "bold", "roman"),
+        "h3": (20, "bold", "roman"),
+        "h4": (18, "bold", "roman"),
+        "alert": (24, "bold", "roman"),
+        "button_large": (20, "normal", "roman"),
+        "button": (18, "normal", "roman"),
+        "body": (16, "normal", "roman"),
+        "body_bold": (16, "bold", "roman"),
+        "italic": (16, "normal", "italic"),
+        "label": (14, "normal", "roman"),
+        "label_bold": (14, "bold", "roman"),
+        "small": (12, "normal", "roman"),
+        "small_bold": (12, "bold", "roman"),
+    }
+
     def __init__(self, root: ctk.CTk):
         """
         Initialize the Quiz Game GUI.
@@ -38,27 +133,29 @@ class QuizApp:
         ctk.set_default_color_theme("blue")
 
         # Color scheme
-        self.colors = {
-            "primary": "#3a7ebf",
-            "secondary": "#1f538d",
-            "accent": "#f5a742",
-            "correct": "#4CAF50",
-            "incorrect": "#F44336",
-            "highlight": "#FFD700",
-            "text_light": "#ffffff",
-            "text_dark": "#333333",
-            "background": "#2b2b2b"
-        }
+        self.colors = _Palette(
+            primary="#3a7ebf",
+            secondary="#1f538d",
+            accent="#f5a742",
+            correct="#4CAF50",
+            incorrect="#F44336",
+            highlight="#FFD700",
+            text_light="#ffffff",
+            text_dark="#333333",
+            background="#2b2b2b"
+        )
 
         # Initialize quiz logic and high scores
         self.quiz_logic = QuizLogic()
         self.high_scores = HighScores()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # Initialize localization system
         self.localization = Localization("en")  # Default to English
 
         # Initialize variables
         self.timer_id = None
+        self._timer_epoch = 0  # Bumped whenever the running timer becomes stale
         self.time_left = 20  # Increased time
         self.selected_option = ""
         self.option_buttons = []
@@ -68,6 +165,19 @@ class QuizApp:
         self.theme_var = ctk.StringVar(value="system")
         self.language_var = ctk.StringVar(value="en")
 
+        # Achievement popup is created lazily on the first unlock and reused
+        self._achievement_popup: Optional[ctk.CTkToplevel] = None
+        self._achievement_title_label: Optional[ctk.CTkLabel] = None
+        self._achievement_desc_label: Optional[ctk.CTkLabel] = None
+
+        # Question screen widgets are built once per quiz and reconfigured
+        # for every question; _q_frame is the content frame they live in and
+        # _q_font_scale the font scale they were built with
+        self._q_frame: Optional[ctk.CTkFrame] = None
+        self._q_font_scale = 0.0
+        self._q_transient: List[tk.Misc] = []
+        self._option_pool: List[ctk.CTkButton] = []
+
         # Scaling factors for responsive design
         self.font_scale = 1.0  # Default font scale
         self.ui_scale = 1.0  # Scale for UI elements (padding, margins)
@@ -77,6 +187,10 @@ class QuizApp:
         self.window_height = 700  # Default window height
         self._last_size = (900, 700)  # Track window size changes
 
+        # Fonts for every role, rebuilt whenever font_scale changes
+        self._font_cache: Dict[Tuple[int, str, str], ctk.CTkFont] = {}
+        self._fonts = self._build_fonts()
+
         # Create main container that fills the window
         self.container = ctk.CTkFrame(self.root)
         self.container.grid(row=0, column=0, sticky="nsew")
@@ -93,6 +207,15 @@ class QuizApp:
         self.content_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
         self.content_frame.grid(row=0, column=0, sticky="nsew")
 
+        # Screens that are kept alive between visits, built on first show.
+        # Only the frame currently on screen is gridded; the rest are hidden.
+        self._frames: Dict[str, ctk.CTkFrame] = {}
+        self._current_screen_frame: Optional[ctk.CTkFrame] = self.content_frame
+
+        # Navigation requested by buttons, applied once the event loop is idle
+        self._pending_screen: Optional[str] = None
+        self._screen_flush_id: Optional[str] = None
+
         # Register for window resize event
         self.root.bind("<Configure>", self.on_window_resize)
 
@@ -100,18 +223,109 @@ class QuizApp:
         self.show_welcome_screen()
 
     def clear_frame(self) -> None:
-        """Clear all widgets from the content frame."""
-        # Destroy previous content frame
-        if hasattr(self, 'content_frame') and self.content_frame is not None:
-            self.content_frame.destroy()
+        """Replace the current screen with a fresh, empty content frame."""
+        self._hide_current_frame()
+        self._current_screen = None
 
         # Create new content frame
-        self.content_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.content_frame = self._new_content_frame()
         self.content_frame.grid(row=0, column=0, sticky="nsew")
+        self._current_screen_frame = self.content_frame
+
+    def _new_content_frame(self) -> ctk.CTkFrame:
+        """
+        Create an empty, ungridded frame for a screen's content.
+
+        Returns:
+            The new frame
+        """
+        frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+        return frame
+
+    def _hide_current_frame(self) -> None:
+        """Hide the frame on screen, destroying it unless it is a cached screen."""
+        frame = self._current_screen_frame
+        if frame is None:
+            return
+
+        if frame in self._frames.values():
+            frame.grid_remove()
+        else:
+            frame.destroy()
+        self._current_screen_frame = None
+
+    def _show_frame(self, name: str, builder: Callable[[], None]) -> ctk.CTkFrame:
+        """
+        Show a cached screen, building it on first use.
+
+        Args:
+            name: Key of the screen in the frame cache
+            builder: Method that fills self.content_frame with the screen's widgets
+
+        Returns:
+            The frame holding the screen
+        """
+        frame = self._frames.get(name)
+        if frame is None or frame is not self._current_screen_frame:
+            self._hide_current_frame()
+
+            if frame is None:
+                frame = self._new_content_frame()
+                self._frames[name] = frame
+                self.content_frame = frame
+                builder()
+
+            frame.grid(row=0, column=0, sticky="nsew")
+            self._current_screen_frame = frame
+
+        self.content_frame = frame
+        self._current_screen = name
+        return frame
+
+    def _invalidate_screens(self, *names: str) -> None:
+        """
+        Drop cached screens so they are rebuilt on their next visit.
+
+        Args:
+            *names: Screens to drop; all cached screens when omitted
+        """
+        for name in names or list(self._frames):
+            frame = self._frames.pop(name, None)
+            if frame is None:
+                continue
+            if frame is self._current_screen_frame:
+                self._current_screen_frame = None
+            frame.destroy()
+
+    def _request_screen(self, name: str) -> None:
+        """
+        Ask for a screen to be shown once the event loop is idle.
+
+        Repeated requests before then (e.g. a double click on a navigation
+        button) are coalesced, so only the latest screen gets built.
 
-        # Configure grid
-        self.content_frame.grid_rowconfigure(0, weight=1)
-        self.content_frame.grid_columnconfigure(0, weight=1)
+        Args:
+            name: Screen to show (welcome, high_scores, achievements, ...)
+        """
+        self._pending_screen = name
+        if self._screen_flush_id is None:
+            self._screen_flush_id = self.root.after_idle(self._flush_screen)
+
+    def _flush_screen(self) -> None:
+        """Show the most recently requested screen, if any."""
+        self._screen_flush_id = None
+        name, self._pending_screen = self._pending_screen, None
+        if name is not None:
+            getattr(self, f"show_{name}_screen")()
+
+    def on_close(self) -> None:
+        """Save unsaved player statistics and added questions, then close the window."""
+        self.cancel_timer()
+        self.high_scores.flush_stats()
+        self.quiz_logic.compact()
+        self.root.destroy()
 
     def on_window_resize(self, event) -> None:
         """
@@ -128,6 +342,7 @@ class QuizApp:
             self.window_height = height
 
             # Adjust font sizes based on window width
+            old_font_scale = self.font_scale
             if width < 500:
                 self.font_scale = 0.75
             elif width < 700:
@@ -137,6 +352,9 @@ class QuizApp:
             else:
                 self.font_scale = 1.0
 
+            if self.font_scale != old_font_scale:
+                self._fonts = self._build_fonts()
+
             # Adjust padding and spacing based on window size
             if width < 600 or height < 500:
                 self.ui_scale = 0.7
@@ -165,6 +383,9 @@ class QuizApp:
                 # Store current screen before refreshing
                 current_screen = getattr(self, '_current_screen', 'welcome')
 
+                # Cached screens were built with the old fonts
+                self._invalidate_screens()
+
                 # Refresh the current screen
                 if current_screen == 'welcome':
                     self.root.after(100, self.show_welcome_screen)
@@ -174,6 +395,8 @@ class QuizApp:
                     self.root.after(100, self.show_results_screen)
                 elif current_screen == 'high_scores':
                     self.root.after(100, self.show_high_scores_screen)
+                elif current_screen == 'achievements':
+                    self.root.after(100, self.show_achievements_screen)
 
             # Store current size for comparison on next resize
             self._last_size = (width, height)
@@ -182,6 +405,9 @@ class QuizApp:
         """
         Get a scaled font based on window size with robust error handling.
 
+        Fonts are cached per (scaled size, weight, slant), so every widget
+        asking for the same spec shares one font object.
+
         Args:
             size: Base font size
             weight: Font weight (normal, bold)
@@ -198,8 +424,13 @@ class QuizApp:
             # Scale the font size based on window size
             scaled_size = int(size * getattr(self, 'font_scale', 1.0))
 
-            # Create and return a new font
-            return ctk.CTkFont(size=scaled_size, weight=weight_val, slant=slant_val)
+            # Reuse the font if this spec has been requested before
+            key = (scaled_size, weight_val, slant_val)
+            font = self._font_cache.get(key)
+            if font is None:
+                font = ctk.CTkFont(size=scaled_size, weight=weight_val, slant=slant_val)
+                self._font_cache[key] = font
+            return font
         except Exception as e:
             # Log the error
             print(f"Error creating font: {e}")
@@ -212,12 +443,25 @@ class QuizApp:
                 print("Critical font creation error, using system default")
                 return None
 
+    def _build_fonts(self) -> Dict[str, ctk.CTkFont]:
+        """
+        Create one font per role in FONT_SPECS at the current font scale.
+
+        Returns:
+            Dictionary mapping role names to fonts
+        """
+        return {
+            role: self.get_font(size, weight, slant)
+            for role, (size, weight, slant) in self.FONT_SPECS.items()
+        }
+
     def show_welcome_screen(self) -> None:
         """Display the welcome screen with options to start quiz or view high scores."""
-        self.clear_frame()
+        self._show_frame('welcome', self._build_welcome_screen)
 
-        # Track current screen for language switching
-        self._current_screen = 'welcome'
+    def _build_welcome_screen(self) -> None:
+        """Build the welcome screen widgets into the content frame."""
+        c = self.colors
 
         # Check if we need RTL layout
         is_rtl = self.localization.is_rtl()
@@ -232,15 +476,15 @@ class QuizApp:
         title_label = ctk.CTkLabel(
             title_frame,
             text=self.get_text("app_title"),
-            font=self.get_font(38, "bold"),
-            text_color=self.colors["accent"]
+            font=self._fonts["h1"],
+            text_color=c.accent
         )
         title_label.pack(pady=(10, 5))
 
         subtitle_label = ctk.CTkLabel(
             title_frame,
             text=self.get_text("welcome_subtitle"),
-            font=self.get_font(16, slant="italic")
+            font=self._fonts["italic"]
         )
         subtitle_label.pack(pady=(0, 30))
 
@@ -256,7 +500,7 @@ class QuizApp:
         questions_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("num_questions"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         questions_label.grid(row=0, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=(20, 10))
 
@@ -276,7 +520,7 @@ class QuizApp:
         difficulty_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("difficulty_level"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         difficulty_label.grid(row=1, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=10)
 
@@ -299,7 +543,7 @@ class QuizApp:
         category_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("category"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         category_label.grid(row=2, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=10)
 
@@ -319,7 +563,7 @@ class QuizApp:
         timer_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("timer_seconds"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         timer_label.grid(row=3, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=10)
 
@@ -339,7 +583,7 @@ class QuizApp:
         theme_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("theme"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         theme_label.grid(row=4, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=10)
 
@@ -370,7 +614,7 @@ class QuizApp:
         language_label = ctk.CTkLabel(
             options_frame,
             text=self.get_text("language"),
-            font=self.get_font(16)
+            font=self._fonts["body"]
         )
         language_label.grid(row=5, column=0, sticky="w" if not is_rtl else "e", padx=20, pady=(10, 20))
 
@@ -412,11 +656,11 @@ class QuizApp:
         start_button = ctk.CTkButton(
             center_frame,
             text=self.get_text("start_quiz"),
-            font=self.get_font(20),
+            font=self._fonts["button_large"],
             height=50,
             width=200,
-            fg_color=self.colors["accent"],
-            hover_color=self.colors["secondary"],
+            fg_color=c.accent,
+            hover_color=c.secondary,
             command=lambda: self.start_quiz(
                 # Map localized difficulty back to internal value
                 difficulty_map.get(difficulty_var.get(), "all"),
@@ -431,10 +675,10 @@ class QuizApp:
         high_scores_button = ctk.CTkButton(
             center_frame,
             text=self.get_text("view_high_scores"),
-            font=self.get_font(16),
+            font=self._fonts["body"],
             height=40,
             width=200,
-            command=self.show_high_scores_screen
+            command=lambda: self._request_screen("high_scores")
         )
         high_scores_button.pack(pady=10)
 
@@ -442,10 +686,10 @@ class QuizApp:
         achievements_button = ctk.CTkButton(
             center_frame,
             text=self.get_text("achievements"),
-            font=self.get_font(16),
+            font=self._fonts["body"],
             height=40,
             width=200,
-            command=self.show_achievements_screen
+            command=lambda: self._request_screen("achievements")
         )
         achievements_button.pack(pady=10)
 
@@ -470,6 +714,9 @@ class QuizApp:
             # Update UI with new language
             self.language_var.set(value)
 
+            # Cached screens hold text in the previous language
+            self._invalidate_screens()
+
             # Refresh the current screen to apply new language
             current_screen = getattr(self, '_current_screen', 'welcome')
             if current_screen == 'welcome':
@@ -524,6 +771,9 @@ class QuizApp:
         Args:
             message: Error message to display
         """
+        c = self.colors
+        f = self.get_font
+
         self.clear_frame()
 
         error_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
@@ -531,7 +781,7 @@ class QuizApp:
 
         error_box = ctk.CTkFrame(
             error_container,
-            fg_color=self.colors["incorrect"],
+            fg_color=c.incorrect,
             corner_radius=10
         )
         error_box.pack(pady=(100, 20), padx=50, ipadx=20, ipady=20)
@@ -539,30 +789,29 @@ class QuizApp:
         error_icon = ctk.CTkLabel(
             error_box,
             text="⚠️",
-            font=self.get_font(30)
+            font=f(30)
         )
         error_icon.pack(pady=(10, 5))
 
         error_label = ctk.CTkLabel(
             error_box,
             text=message,
-            font=self.get_font(18),
-            text_color=self.colors["text_light"]
+            font=f(18),
+            text_color=c.text_light
         )
         error_label.pack(pady=(0, 10))
 
         back_button = ctk.CTkButton(
             error_container,
             text="Back to Menu",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            command=self.show_welcome_screen
+            command=lambda: self._request_screen("welcome")
         )
         back_button.pack(pady=20)
 
     def show_question_screen(self) -> None:
         """Display the current question with options and timer with enhanced UI."""
-        self.clear_frame()
         self.cancel_timer()
 
         question = self.quiz_logic.get_current_question()
@@ -570,54 +819,75 @@ class QuizApp:
             self.show_results_screen()
             return
 
+        # The layout survives between questions; only rebuild it when another
+        # screen has replaced it since the last question was shown, or when a
+        # resize has changed the fonts
+        if self._q_frame is not self.content_frame or self._q_font_scale != self.font_scale:
+            self._build_question_screen()
+
+        self._refresh_question_screen(question)
+
+    def _build_question_screen(self) -> None:
+        """
+        Build the persistent question screen layout.
+
+        Creates every widget that stays on screen for the whole quiz and keeps
+        references to the ones that change per question, so that moving to
+        the next question only needs to reconfigure them.
+        """
+        c = self.colors
+
+        self.clear_frame()
+
+        # Track current screen for language switching
+        self._current_screen = 'question'
+
         question_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         question_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._q_container = question_container
 
         # Top bar with stats
         top_bar = ctk.CTkFrame(question_container)
         top_bar.pack(fill=tk.X, pady=(5, 15))
 
         # Progress indicator
-        current, total = self.quiz_logic.get_progress()
-
-        progress_label = ctk.CTkLabel(
+        self._q_progress_label = ctk.CTkLabel(
             top_bar,
-            text=f"Question {current} of {total}",
-            font=self.get_font(14)
+            text="",
+            font=self._fonts["label"]
         )
-        progress_label.pack(side=tk.LEFT, padx=10)
+        self._q_progress_label.pack(side=tk.LEFT, padx=10)
 
         # Streak indicator
-        streak_frame = ctk.CTkFrame(top_bar, fg_color=self.colors["accent"] if self.current_streak > 2 else "transparent")
-        streak_frame.pack(side=tk.LEFT, padx=10)
+        self._q_streak_frame = ctk.CTkFrame(top_bar, fg_color="transparent")
+        self._q_streak_frame.pack(side=tk.LEFT, padx=10)
 
-        streak_label = ctk.CTkLabel(
-            streak_frame,
-            text=f"🔥 Streak: {self.current_streak}",
-            font=self.get_font(14),
-            text_color="black" if self.current_streak > 2 else None
+        self._q_streak_label = ctk.CTkLabel(
+            self._q_streak_frame,
+            text="",
+            font=self._fonts["label"]
         )
-        streak_label.pack(padx=5)
+        self._q_streak_label.pack(padx=5)
+        self._q_streak_text_color = self._q_streak_label.cget("text_color")
 
-        score_label = ctk.CTkLabel(
+        self._q_score_label = ctk.CTkLabel(
             top_bar,
-            text=f"Score: {self.quiz_logic.score}",
-            font=self.get_font(14, "bold")
+            text="",
+            font=self._fonts["label_bold"]
         )
-        score_label.pack(side=tk.RIGHT, padx=10)
+        self._q_score_label.pack(side=tk.RIGHT, padx=10)
 
         # Progress bar with color
         progress_frame = ctk.CTkFrame(question_container)
         progress_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
 
-        progress_bar = ctk.CTkProgressBar(
+        self._q_progress_bar = ctk.CTkProgressBar(
             progress_frame,
             width=700,
-            progress_color=self.colors["accent"],
+            progress_color=c.accent,
             height=10
         )
-        progress_bar.pack(fill=tk.X, pady=5)
-        progress_bar.set(current / total)
+        self._q_progress_bar.pack(fill=tk.X, pady=5)
 
         # Question card
         question_card = ctk.CTkFrame(question_container)
@@ -627,76 +897,69 @@ class QuizApp:
         meta_frame = ctk.CTkFrame(question_card, fg_color="transparent")
         meta_frame.pack(fill=tk.X, padx=15, pady=(10, 0))
 
-        difficulty = question.get("difficulty", "").capitalize()
-        category = question.get("category", "")
-
         # Create difficulty badge
-        diff_colors = {"Easy": "#4CAF50", "Medium": "#FF9800", "Hard": "#F44336"}
-        diff_badge = ctk.CTkFrame(
+        self._q_diff_badge = ctk.CTkFrame(
             meta_frame,
-            fg_color=diff_colors.get(difficulty, self.colors["primary"]),
+            fg_color=c.primary,
             corner_radius=5
         )
-        diff_badge.pack(side=tk.LEFT, padx=(0, 10))
+        self._q_diff_badge.pack(side=tk.LEFT, padx=(0, 10))
 
-        diff_label = ctk.CTkLabel(
-            diff_badge,
-            text=difficulty,
-            font=self.get_font(12),
+        self._q_diff_label = ctk.CTkLabel(
+            self._q_diff_badge,
+            text="",
+            font=self._fonts["small"],
             text_color="white"
         )
-        diff_label.pack(padx=8, pady=2)
+        self._q_diff_label.pack(padx=8, pady=2)
 
         # Category badge
-        cat_badge = ctk.CTkFrame(meta_frame, fg_color=self.colors["secondary"], corner_radius=5)
+        cat_badge = ctk.CTkFrame(meta_frame, fg_color=c.secondary, corner_radius=5)
         cat_badge.pack(side=tk.LEFT)
 
-        cat_label = ctk.CTkLabel(
+        self._q_cat_label = ctk.CTkLabel(
             cat_badge,
-            text=category,
-            font=self.get_font(12),
+            text="",
+            font=self._fonts["small"],
             text_color="white"
         )
-        cat_label.pack(padx=8, pady=2)
+        self._q_cat_label.pack(padx=8, pady=2)
 
         # Points indicator
-        points_map = {"Easy": 10, "Medium": 15, "Hard": 20}
-        points_value = points_map.get(difficulty, 10)
-
-        points_label = ctk.CTkLabel(
+        self._q_points_label = ctk.CTkLabel(
             meta_frame,
-            text=f"+{points_value} pts",
-            font=self.get_font(12, "bold"),
-            text_color=self.colors["highlight"]
+            text="",
+            font=self._fonts["small_bold"],
+            text_color=c.highlight
         )
-        points_label.pack(side=tk.RIGHT)
+        self._q_points_label.pack(side=tk.RIGHT)
 
         # Question text with better wrapping
-        question_text = question.get("question", "")
-        question_label = ctk.CTkLabel(
+        self._q_question_label = ctk.CTkLabel(
             question_card,
-            text=question_text,
-            font=self.get_font(20, "bold"),
+            text="",
+            font=self._fonts["h3"],
             wraplength=600,
             justify="left"
         )
-        question_label.pack(pady=(15, 20), padx=20)
+        self._q_question_label.pack(pady=(15, 20), padx=20)
 
         # Timer with circular progress bar
         timer_frame = ctk.CTkFrame(question_container)
         timer_frame.pack(pady=(0, 15))
 
-        timer_label = ctk.CTkLabel(
+        self._q_timer_label = ctk.CTkLabel(
             timer_frame,
-            text=f"{self.time_left}",
-            font=self.get_font(22, "bold")
+            text="",
+            font=self._fonts["h2"]
         )
-        timer_label.pack(pady=5)
+        self._q_timer_label.pack(pady=5)
+        self._q_timer_text_color = self._q_timer_label.cget("text_color")
 
         timer_text = ctk.CTkLabel(
             timer_frame,
             text="seconds remaining",
-            font=self.get_font(12)
+            font=self._fonts["small"]
         )
         timer_text.pack(pady=(0, 5))
 
@@ -707,38 +970,25 @@ class QuizApp:
         options_frame.columnconfigure(0, weight=1)
         options_frame.columnconfigure(1, weight=1)
 
-        # Reset selected option
-        self.selected_option = ""
-        self.option_buttons = []
-
-        options = self.quiz_logic.get_shuffled_options()
-
-        # Arrange options in a 2x2 grid
-        row, col = 0, 0
-        option_letters = ["A", "B", "C", "D"]
-
-        for i, option in enumerate(options):
+        # Arrange a fixed pool of option buttons in a 2x2 grid
+        self._option_pool = []
+        for i in range(4):
             option_frame = ctk.CTkFrame(options_frame)
-            option_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+            option_frame.grid(row=i // 2, column=i % 2, padx=10, pady=10, sticky="nsew")
 
             option_button = ctk.CTkButton(
                 option_frame,
-                text=f"{option_letters[i]}. {option}",
-                font=self.get_font(16),
+                text="",
+                font=self._fonts["body"],
                 height=60,
                 anchor="w",
-                fg_color=self.colors["primary"],
-                hover_color=self.colors["secondary"],
-                command=lambda opt=option: self.select_option(opt)
+                fg_color=c.primary,
+                hover_color=c.secondary
             )
             option_button.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-            self.option_buttons.append((option_button, option))
+            self._option_pool.append(option_button)
 
-            # Move to next column or row
-            col += 1
-            if col > 1:
-                col = 0
-                row += 1
+        self._option_text_color = self._option_pool[0].cget("text_color")
 
         # Submit button with accent color
         button_frame = ctk.CTkFrame(question_container, fg_color="transparent")
@@ -747,12 +997,12 @@ class QuizApp:
         self.submit_button = ctk.CTkButton(
             button_frame,
             text="Submit Answer",
-            font=self.get_font(18),
+            font=self._fonts["button"],
             height=50,
             width=200,
             state="disabled",
-            fg_color=self.colors["accent"],
-            hover_color=self.colors["secondary"],
+            fg_color=c.accent,
+            hover_color=c.secondary,
             command=self.submit_answer
         )
         self.submit_button.pack()
@@ -761,7 +1011,7 @@ class QuizApp:
         hint_button = ctk.CTkButton(
             button_frame,
             text="Use Hint (−5 pts)",
-            font=self.get_font(14),
+            font=self._fonts["label"],
             height=30,
             width=150,
             fg_color="gray",
@@ -773,7 +1023,7 @@ class QuizApp:
         skip_button = ctk.CTkButton(
             button_frame,
             text="Skip Question",
-            font=self.get_font(14),
+            font=self._fonts["label"],
             height=30,
             width=150,
             fg_color="#555555",
@@ -782,8 +1032,82 @@ class QuizApp:
         )
         skip_button.pack()
 
+        # Correct/incorrect banner, placed over the question once answered
+        self._q_feedback_frame = ctk.CTkFrame(self.content_frame, corner_radius=10)
+        self._q_feedback_label = ctk.CTkLabel(
+            self._q_feedback_frame,
+            text="",
+            font=self._fonts["h4"],
+            text_color="white"
+        )
+        self._q_feedback_label.pack(padx=15, pady=8)
+
+        self._q_frame = self.content_frame
+        self._q_font_scale = self.font_scale
+
+    def _refresh_question_screen(self, question: Dict[str, Any]) -> None:
+        """
+        Update the persistent question screen for the given question.
+
+        Args:
+            question: The question to display
+        """
+        # Remove per-question feedback left over from the previous answer
+        for widget in self._q_transient:
+            widget.destroy()
+        self._q_transient = []
+        self._q_feedback_frame.place_forget()
+
+        current, total = self.quiz_logic.get_progress()
+        self._q_progress_label.configure(text=f"Question {current} of {total}")
+        self._q_progress_bar.set(current / total)
+
+        # Streak indicator
+        on_fire = self.current_streak > 2
+        self._q_streak_frame.configure(fg_color=self.colors.accent if on_fire else "transparent")
+        self._q_streak_label.configure(
+            text=f"🔥 Streak: {self.current_streak}",
+            text_color="black" if on_fire else self._q_streak_text_color
+        )
+
+        self._q_score_label.configure(text=f"Score: {self.quiz_logic.score}")
+
+        # Question metadata
+        difficulty = question.get("difficulty", "").capitalize()
+        diff_colors = {"Easy": "#4CAF50", "Medium": "#FF9800", "Hard": "#F44336"}
+        self._q_diff_badge.configure(fg_color=diff_colors.get(difficulty, self.colors.primary))
+        self._q_diff_label.configure(text=difficulty)
+        self._q_cat_label.configure(text=question.get("category", ""))
+
+        self._q_points_label.configure(text=f"+{question.points} pts")
+
+        self._q_question_label.configure(text=question.get("question", ""))
+
+        self._q_timer_label.configure(text=f"{self.time_left}", text_color=self._q_timer_text_color)
+
+        # Reset selected option
+        self.selected_option = ""
+        self.option_buttons = []
+
+        options = self.quiz_logic.get_shuffled_options()
+        option_letters = ["A", "B", "C", "D"]
+
+        for i, (option_button, option) in enumerate(zip(self._option_pool, options)):
+            option_button.configure(
+                text=f"{option_letters[i]}. {option}",
+                state="normal",
+                fg_color=self.colors.primary,
+                hover_color=self.colors.secondary,
+                text_color=self._option_text_color,
+                border_width=0,
+                command=lambda opt=option: self.select_option(opt)
+            )
+            self.option_buttons.append((option_button, option))
+
+        self.submit_button.configure(state="disabled")
+
         # Start timer
-        self.start_timer(timer_label)
+        self.start_timer(self._q_timer_label)
 
     def show_hint(self) -> None:
         """Show a hint by eliminating wrong options."""
@@ -809,14 +1133,7 @@ class QuizApp:
         self.quiz_logic.score = max(0, self.quiz_logic.score - 5)
 
         # Update score display
-        for widget in self.content_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                for child in widget.winfo_children():
-                    if isinstance(child, ctk.CTkFrame):
-                        for label in child.winfo_children():
-                            if isinstance(label, ctk.CTkLabel) and "Score:" in label.cget("text"):
-                                label.configure(text=f"Score: {self.quiz_logic.score}")
-                                break
+        self._q_score_label.configure(text=f"Score: {self.quiz_logic.score}")
 
     def skip_question(self) -> None:
         """Skip the current question and move to the next one."""
@@ -839,13 +1156,13 @@ class QuizApp:
         for button, opt in self.option_buttons:
             if opt == option:
                 button.configure(
-                    fg_color=self.colors["secondary"],
-                    border_color=self.colors["highlight"],
+                    fg_color=self.colors.secondary,
+                    border_color=self.colors.highlight,
                     border_width=2
                 )  # Highlight selected
             else:
                 button.configure(
-                    fg_color=self.colors["primary"],
+                    fg_color=self.colors.primary,
                     border_width=0
                 )  # Reset others
 
@@ -856,33 +1173,31 @@ class QuizApp:
         Args:
             timer_label: Label to display the timer
         """
+        # Remember which question this timer belongs to; a stale epoch means
+        # the question is no longer live and the tick must do nothing.
+        epoch = self._timer_epoch
+
         def update_timer():
-            # Use a try-except block to handle any potential errors
+            if epoch != self._timer_epoch:
+                return
+
             try:
                 self.time_left -= 1
+                timer_label.configure(text=f"{self.time_left}")
 
-                # Check if the timer_label still exists before updating it
-                if timer_label.winfo_exists():
-                    # Use after method to ensure UI updates happen in the main thread
-                    self.root.after_idle(lambda: timer_label.configure(text=f"{self.time_left}"))
-
-                    # Change color to warn when time is running low
-                    if self.time_left <= 5:
-                        self.root.after_idle(lambda: timer_label.configure(text_color=self.colors["incorrect"]))
-                    elif self.time_left <= 10:
-                        self.root.after_idle(lambda: timer_label.configure(text_color=self.colors["accent"]))
-
-                    if self.time_left <= 0:
-                        # Use after_idle to ensure time_expired is called in the main thread
-                        self.root.after_idle(self.time_expired)
-                    else:
-                        # Schedule the next timer update
-                        self.timer_id = self.root.after(1000, update_timer)
+                # Change color to warn when time is running low
+                if self.time_left <= 5:
+                    timer_label.configure(text_color=self.colors.incorrect)
+                elif self.time_left <= 10:
+                    timer_label.configure(text_color=self.colors.accent)
+
+                if self.time_left <= 0:
+                    self.root.after_idle(self.time_expired)
                 else:
-                    # Label no longer exists, cancel the timer
-                    self.cancel_timer()
-            except (tk.TclError, RuntimeError, Exception) as e:
-                # Handle any errors by canceling the timer and logging the error
+                    # Schedule the next timer update
+                    self.timer_id = self.root.after(1000, update_timer)
+            except tk.TclError as e:
+                # The label was destroyed underneath us
                 print(f"Timer error: {e}")
                 self.cancel_timer()
 
@@ -891,6 +1206,7 @@ class QuizApp:
 
     def cancel_timer(self) -> None:
         """Cancel the current timer if active."""
+        self._timer_epoch += 1
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
             self.timer_id = None
@@ -902,29 +1218,18 @@ class QuizApp:
         # Reset streak
         self.current_streak = 0
         
-        # Since time expired, mark question as incorrect (skipped)
-        self.quiz_logic.skipped_questions += 1
-        
-        # Get current question for recording time data
-        question = self.quiz_logic.get_current_question()
-        if question:
-            # Record the answer time for statistics
-            question["answer_time"] = time.time()
-            time_taken = question["answer_time"] - question.get("start_time", question["answer_time"])
-            self.quiz_logic.question_times.append(time_taken)
-            question["points_awarded"] = 0  # No points for expired timer
+        # Since time expired, mark question as skipped and record its time
+        self.quiz_logic.expire_question()
 
         # Show "Time's Up!" message
-        for widget in self.content_frame.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                time_up_label = ctk.CTkLabel(
-                    widget,
-                    text="Time's Up!",
-                    font=self.get_font(24, "bold"),
-                    text_color=self.colors["incorrect"]
-                )
-                time_up_label.pack(pady=10)
-                break
+        time_up_label = ctk.CTkLabel(
+            self._q_container,
+            text="Time's Up!",
+            font=self._fonts["alert"],
+            text_color=self.colors.incorrect
+        )
+        time_up_label.pack(pady=10)
+        self._q_transient.append(time_up_label)
 
         self.show_correct_answer(False)
 
@@ -948,10 +1253,11 @@ class QuizApp:
                 streak_bonus_label = ctk.CTkLabel(
                     self.content_frame,
                     text=f"🔥 Streak Bonus: +{streak_bonus} points!",
-                    font=self.get_font(16, "bold"),
-                    text_color=self.colors["highlight"]
+                    font=self._fonts["body_bold"],
+                    text_color=self.colors.highlight
                 )
                 streak_bonus_label.place(relx=0.5, rely=0.2, anchor=tk.CENTER)
+                self._q_transient.append(streak_bonus_label)
 
             if self.current_streak >= 5 and "streak_5" not in self.achievements:
                 self.achievements["streak_5"] = True
@@ -979,16 +1285,31 @@ class QuizApp:
             title: Achievement title
             description: Achievement description
         """
-        # Create achievement popup
+        # Build the popup once and reuse it for every later achievement
+        if self._achievement_popup is None or not self._achievement_popup.winfo_exists():
+            self._build_achievement_popup()
+
+        self._achievement_title_label.configure(text=title)
+        self._achievement_desc_label.configure(text=description)
+
+        # Position popup in center of parent window
+        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - 200
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 100
+        self._achievement_popup.geometry(f"+{x}+{y}")
+
+        self._achievement_popup.deiconify()
+        self._achievement_popup.lift()
+
+    def _build_achievement_popup(self) -> None:
+        """Create the hidden achievement popup and keep references to its labels."""
         popup = ctk.CTkToplevel(self.root)
+        popup.withdraw()
         popup.title("Achievement Unlocked!")
         popup.geometry("400x200")
         popup.resizable(False, False)
 
-        # Position popup in center of parent window
-        x = self.root.winfo_x() + (self.root.winfo_width() // 2) - 200
-        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 100
-        popup.geometry(f"+{x}+{y}")
+        # Closing the window hides it so it can be shown again later
+        popup.protocol("WM_DELETE_WINDOW", popup.withdraw)
 
         # Achievement content
         frame = ctk.CTkFrame(popup)
@@ -998,36 +1319,38 @@ class QuizApp:
         header_label = ctk.CTkLabel(
             frame,
             text="🏆 Achievement Unlocked!",
-            font=self.get_font(22, "bold"),
-            text_color=self.colors["highlight"]
+            font=self._fonts["h2"],
+            text_color=self.colors.highlight
         )
         header_label.pack(pady=(10, 5))
 
         # Achievement title
-        title_label = ctk.CTkLabel(
+        self._achievement_title_label = ctk.CTkLabel(
             frame,
-            text=title,
-            font=self.get_font(18, "bold")
+            text="",
+            font=self._fonts["h4"]
         )
-        title_label.pack(pady=(5, 10))
+        self._achievement_title_label.pack(pady=(5, 10))
 
         # Description
-        desc_label = ctk.CTkLabel(
+        self._achievement_desc_label = ctk.CTkLabel(
             frame,
-            text=description,
-            font=self.get_font(14)
+            text="",
+            font=self._fonts["label"]
         )
-        desc_label.pack(pady=(0, 15))
+        self._achievement_desc_label.pack(pady=(0, 15))
 
         # Close button
         close_button = ctk.CTkButton(
             frame,
             text="Continue",
-            command=popup.destroy,
+            command=popup.withdraw,
             width=100
         )
         close_button.pack()
 
+        self._achievement_popup = popup
+
     def show_correct_answer(self, is_correct: Optional[bool] = None) -> None:
         """
         Highlight the correct answer and the user's selection with enhanced visual feedback.
@@ -1041,35 +1364,26 @@ class QuizApp:
 
         correct_answer = question.get("correct_answer", "")
 
-        # Create feedback message
-        feedback_frame = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=self.colors["correct"] if is_correct else self.colors["incorrect"],
-            corner_radius=10
-        )
-        feedback_frame.place(relx=0.5, rely=0.1, anchor=tk.CENTER)
-
-        feedback_text = "✓ Correct!" if is_correct else "✗ Incorrect!"
-        feedback_label = ctk.CTkLabel(
-            feedback_frame,
-            text=feedback_text,
-            font=self.get_font(18, "bold"),
-            text_color="white"
+        # Show the feedback message; it is hidden again by the next refresh
+        self._q_feedback_frame.configure(
+            fg_color=self.colors.correct if is_correct else self.colors.incorrect
         )
-        feedback_label.pack(padx=15, pady=8)
+        self._q_feedback_label.configure(text="✓ Correct!" if is_correct else "✗ Incorrect!")
+        self._q_feedback_frame.place(relx=0.5, rely=0.1, anchor=tk.CENTER)
+        self._q_feedback_frame.lift()
 
         # Update buttons with improved visual feedback
         for button, option in self.option_buttons:
             if option == correct_answer:
                 button.configure(
-                    fg_color=self.colors["correct"],
-                    hover_color=self.colors["correct"],
+                    fg_color=self.colors.correct,
+                    hover_color=self.colors.correct,
                     text_color="white"
                 )  # Correct answer
             elif is_correct is not None and option == self.selected_option and not is_correct:
                 button.configure(
-                    fg_color=self.colors["incorrect"],
-                    hover_color=self.colors["incorrect"],
+                    fg_color=self.colors.incorrect,
+                    hover_color=self.colors.incorrect,
                     text_color="white"
                 )  # Wrong answer
             else:
@@ -1080,15 +1394,17 @@ class QuizApp:
             time_expired_label = ctk.CTkLabel(
                 self.content_frame,
                 text="No answer selected!",
-                font=self.get_font(16),
-                text_color=self.colors["incorrect"]
+                font=self._fonts["body"],
+                text_color=self.colors.incorrect
             )
             time_expired_label.place(relx=0.5, rely=0.2, anchor=tk.CENTER)
+            self._q_transient.append(time_expired_label)
 
         self.submit_button.configure(state="disabled")
 
     def move_to_next_question(self) -> None:
         """Move to the next question or show results if quiz is complete."""
+        self._timer_epoch += 1
         if self.quiz_logic.next_question():
             self.show_question_screen()
         else:
@@ -1096,7 +1412,18 @@ class QuizApp:
 
     def show_results_screen(self) -> None:
         """Display the final results screen with enhanced visual feedback and statistics."""
-        self.clear_frame()
+        self._show_frame('results', self._build_results_screen)
+        self._refresh_results_screen()
+
+    def _build_results_screen(self) -> None:
+        """
+        Build the results screen widgets into the content frame.
+
+        The labels that depend on the finished quiz are stored on self and
+        filled in by _refresh_results_screen.
+        """
+        c = self.colors
+        f = self.get_font
 
         results_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         results_container.pack(fill=tk.BOTH, expand=True)
@@ -1108,8 +1435,8 @@ class QuizApp:
         title_label = ctk.CTkLabel(
             title_frame,
             text="🎉 Quiz Complete! 🎉",
-            font=self.get_font(32, "bold"),
-            text_color=self.colors["accent"]
+            font=f(32, "bold"),
+            text_color=c.accent
         )
         title_label.pack(pady=(20, 10))
 
@@ -1118,23 +1445,23 @@ class QuizApp:
         stats_frame.pack(pady=20, padx=40, fill=tk.X)
 
         # Final score with large display
-        score_label = ctk.CTkLabel(
+        self._results_score_label = ctk.CTkLabel(
             stats_frame,
-            text=f"{self.quiz_logic.score}",
-            font=self.get_font(48, "bold"),
-            text_color=self.colors["highlight"]
+            text="",
+            font=f(48, "bold"),
+            text_color=c.highlight
         )
-        score_label.pack(pady=(20, 5))
+        self._results_score_label.pack(pady=(20, 5))
 
         score_text = ctk.CTkLabel(
             stats_frame,
             text="POINTS",
-            font=self.get_font(16),
+            font=f(16),
         )
         score_text.pack(pady=(0, 20))
 
         # Divider
-        divider = ctk.CTkFrame(stats_frame, height=2, fg_color=self.colors["primary"])
+        divider = ctk.CTkFrame(stats_frame, height=2, fg_color=c.primary)
         divider.pack(fill=tk.X, padx=30, pady=10)
 
         # Additional statistics
@@ -1149,120 +1476,111 @@ class QuizApp:
         streak_title = ctk.CTkLabel(
             stats_grid,
             text="Longest Streak:",
-            font=self.get_font(14),
+            font=f(14),
             anchor="e"
         )
         streak_title.grid(row=0, column=0, sticky="e", padx=(20, 10), pady=5)
 
-        streak_value = ctk.CTkLabel(
+        self._results_streak_value = ctk.CTkLabel(
             stats_grid,
-            text=f"{self.longest_streak}",
-            font=self.get_font(14, "bold"),
+            text="",
+            font=f(14, "bold"),
             anchor="w"
         )
-        streak_value.grid(row=0, column=1, sticky="w", padx=(10, 20), pady=5)
+        self._results_streak_value.grid(row=0, column=1, sticky="w", padx=(10, 20), pady=5)
 
         # Difficulty
         difficulty_title = ctk.CTkLabel(
             stats_grid,
             text="Difficulty:",
-            font=self.get_font(14),
+            font=f(14),
             anchor="e"
         )
         difficulty_title.grid(row=1, column=0, sticky="e", padx=(20, 10), pady=5)
 
-        difficulty_value = ctk.CTkLabel(
+        self._results_difficulty_value = ctk.CTkLabel(
             stats_grid,
-            text=f"{self.quiz_logic.difficulty.capitalize()}",
-            font=self.get_font(14, "bold"),
+            text="",
+            font=f(14, "bold"),
             anchor="w"
         )
-        difficulty_value.grid(row=1, column=1, sticky="w", padx=(10, 20), pady=5)
+        self._results_difficulty_value.grid(row=1, column=1, sticky="w", padx=(10, 20), pady=5)
 
         # Questions
         questions_title = ctk.CTkLabel(
             stats_grid,
             text="Questions:",
-            font=self.get_font(14),
+            font=f(14),
             anchor="e"
         )
         questions_title.grid(row=2, column=0, sticky="e", padx=(20, 10), pady=5)
 
-        _, total_questions = self.quiz_logic.get_progress()
-        questions_value = ctk.CTkLabel(
+        self._results_questions_value = ctk.CTkLabel(
             stats_grid,
-            text=f"{total_questions}",
-            font=self.get_font(14, "bold"),
+            text="",
+            font=f(14, "bold"),
             anchor="w"
         )
-        questions_value.grid(row=2, column=1, sticky="w", padx=(10, 20), pady=5)
+        self._results_questions_value.grid(row=2, column=1, sticky="w", padx=(10, 20), pady=5)
 
-        # Achievement unlocked (if applicable)
-        if self.longest_streak >= 3 or self.quiz_logic.score >= 100:
-            achievement_frame = ctk.CTkFrame(stats_frame, fg_color=self.colors["highlight"])
-            achievement_frame.pack(pady=15, padx=50, fill=tk.X)
-
-            achievement_label = ctk.CTkLabel(
-                achievement_frame,
-                text="🏆 New Achievement Unlocked!",
-                font=self.get_font(14, "bold"),
-                text_color="black"
-            )
-            achievement_label.pack(pady=5)
+        # Achievement unlocked (packed only when applicable)
+        self._results_achievement_frame = ctk.CTkFrame(stats_frame, fg_color=c.highlight)
 
-        # Check if it's a high score
-        is_high_score = self.high_scores.is_high_score(self.quiz_logic.score)
-
-        if is_high_score:
-            # High score badge
-            high_score_frame = ctk.CTkFrame(
-                results_container,
-                fg_color=self.colors["highlight"],
-                corner_radius=10
-            )
-            high_score_frame.pack(pady=15)
+        achievement_label = ctk.CTkLabel(
+            self._results_achievement_frame,
+            text="🏆 New Achievement Unlocked!",
+            font=f(14, "bold"),
+            text_color="black"
+        )
+        achievement_label.pack(pady=5)
 
-            high_score_label = ctk.CTkLabel(
-                high_score_frame,
-                text="🌟 New High Score! 🌟",
-                font=self.get_font(20, "bold"),
-                text_color="black"
-            )
-            high_score_label.pack(pady=10, padx=20)
+        # High score badge (packed only for a high score)
+        self._results_high_score_frame = ctk.CTkFrame(
+            results_container,
+            fg_color=c.highlight,
+            corner_radius=10
+        )
 
-            # Name input with improved styling
-            name_frame = ctk.CTkFrame(results_container)
-            name_frame.pack(pady=10, fill=tk.X, padx=100)
+        high_score_label = ctk.CTkLabel(
+            self._results_high_score_frame,
+            text="🌟 New High Score! 🌟",
+            font=f(20, "bold"),
+            text_color="black"
+        )
+        high_score_label.pack(pady=10, padx=20)
 
-            name_label = ctk.CTkLabel(
-                name_frame,
-                text="Enter your name:",
-                font=self.get_font(16)
-            )
-            name_label.pack(pady=(10, 5))
+        # Name input with improved styling
+        self._results_name_frame = ctk.CTkFrame(results_container)
 
-            name_entry = ctk.CTkEntry(
-                name_frame,
-                width=200,
-                placeholder_text="Your name here"
-            )
-            name_entry.pack(pady=5)
-            name_entry.insert(0, "Player")
-
-            # Save score button
-            save_button = ctk.CTkButton(
-                name_frame,
-                text="Save Score",
-                font=self.get_font(16),
-                fg_color=self.colors["accent"],
-                hover_color=self.colors["secondary"],
-                command=lambda: self.save_score(name_entry.get())
-            )
-            save_button.pack(pady=10)
+        name_label = ctk.CTkLabel(
+            self._results_name_frame,
+            text="Enter your name:",
+            font=f(16)
+        )
+        name_label.pack(pady=(10, 5))
+
+        self._results_name_entry = ctk.CTkEntry(
+            self._results_name_frame,
+            width=200,
+            placeholder_text="Your name here"
+        )
+        self._results_name_entry.pack(pady=5)
+
+        # Save score button
+        save_button = ctk.CTkButton(
+            self._results_name_frame,
+            text="Save Score",
+            font=f(16),
+            fg_color=c.accent,
+            hover_color=c.secondary,
+            command=lambda: self.save_score(self._results_name_entry.get())
+        )
+        save_button.pack(pady=10)
 
         # Buttons with improved layout
         buttons_frame = ctk.CTkFrame(results_container, fg_color="transparent")
         buttons_frame.pack(pady=20, fill=tk.X)
+        self._results_buttons_frame = buttons_frame
 
         # Configure columns for button layout
         buttons_frame.columnconfigure(0, weight=1)
@@ -1272,32 +1590,58 @@ class QuizApp:
         play_again_button = ctk.CTkButton(
             buttons_frame,
             text="Play Again",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            fg_color=self.colors["primary"],
-            hover_color=self.colors["secondary"],
-            command=self.show_welcome_screen
+            fg_color=c.primary,
+            hover_color=c.secondary,
+            command=lambda: self._request_screen("welcome")
         )
         play_again_button.grid(row=0, column=0, padx=10, pady=10)
 
         high_scores_button = ctk.CTkButton(
             buttons_frame,
             text="High Scores",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            command=self.show_high_scores_screen
+            command=lambda: self._request_screen("high_scores")
         )
         high_scores_button.grid(row=0, column=1, padx=10, pady=10)
 
         achievements_button = ctk.CTkButton(
             buttons_frame,
             text="Achievements",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            command=self.show_achievements_screen
+            command=lambda: self._request_screen("achievements")
         )
         achievements_button.grid(row=0, column=2, padx=10, pady=10)
 
+    def _refresh_results_screen(self) -> None:
+        """Fill the cached results screen with the statistics of the finished quiz."""
+        self._results_score_label.configure(text=f"{self.quiz_logic.score}")
+        self._results_streak_value.configure(text=f"{self.longest_streak}")
+        self._results_difficulty_value.configure(text=f"{self.quiz_logic.difficulty.capitalize()}")
+
+        _, total_questions = self.quiz_logic.get_progress()
+        self._results_questions_value.configure(text=f"{total_questions}")
+
+        # Achievement unlocked (if applicable)
+        if self.longest_streak >= 3 or self.quiz_logic.score >= 100:
+            self._results_achievement_frame.pack(pady=15, padx=50, fill=tk.X)
+        else:
+            self._results_achievement_frame.pack_forget()
+
+        # Check if it's a high score
+        if self.high_scores.is_high_score(self.quiz_logic.score):
+            self._results_high_score_frame.pack(pady=15, before=self._results_buttons_frame)
+            self._results_name_frame.pack(pady=10, fill=tk.X, padx=100, before=self._results_buttons_frame)
+
+            self._results_name_entry.delete(0, tk.END)
+            self._results_name_entry.insert(0, "Player")
+        else:
+            self._results_high_score_frame.pack_forget()
+            self._results_name_frame.pack_forget()
+
     def save_score(self, name: str) -> None:
         """
         Save the player's score to high scores.
@@ -1310,10 +1654,13 @@ class QuizApp:
 
     def show_high_scores_screen(self) -> None:
         """Display the high scores screen with enhanced visual style and responsiveness."""
-        self.clear_frame()
+        self._show_frame('high_scores', self._build_high_scores_screen)
+        self._refresh_high_scores_screen()
 
-        # Refresh high scores
-        self.high_scores.load_scores()
+    def _build_high_scores_screen(self) -> None:
+        """Build the high scores screen widgets into the content frame."""
+        c = self.colors
+        f = self.get_font
 
         scores_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         scores_container.pack(fill=tk.BOTH, expand=True)
@@ -1325,8 +1672,8 @@ class QuizApp:
         title_label = ctk.CTkLabel(
             title_frame,
             text="🏆 High Scores 🏆",
-            font=self.get_font(32, "bold"),
-            text_color=self.colors["highlight"]
+            font=f(32, "bold"),
+            text_color=c.highlight
         )
         title_label.pack(pady=(10, 0))
 
@@ -1334,102 +1681,48 @@ class QuizApp:
         scores_card = ctk.CTkFrame(scores_container)
         scores_card.pack(pady=20, fill=tk.BOTH, expand=True, padx=40)
 
-        # Headers with colored background
-        header_frame = ctk.CTkFrame(scores_card, fg_color=self.colors["secondary"])
-        header_frame.pack(fill=tk.X, pady=(0, 2))
-
-        # Configure columns for responsiveness
-        header_frame.columnconfigure(0, weight=1)
-        header_frame.columnconfigure(1, weight=3)
-        header_frame.columnconfigure(2, weight=1)
-
-        rank_header = ctk.CTkLabel(
-            header_frame,
-            text="RANK",
-            font=self.get_font(16, "bold"),
-            text_color="white"
+        # Rows are rendered by a single native Treeview instead of one
+        # frame and three labels per score
+        style = ttk.Style(self.root)
+        style.configure(
+            "HighScores.Treeview",
+            font=f(14),
+            rowheight=int(36 * self.font_scale)
         )
-        rank_header.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
-
-        name_header = ctk.CTkLabel(
-            header_frame,
-            text="NAME",
-            font=self.get_font(16, "bold"),
-            text_color="white"
+        style.configure(
+            "HighScores.Treeview.Heading",
+            font=f(16, "bold"),
+            background=c.secondary,
+            foreground="white"
         )
-        name_header.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
 
-        score_header = ctk.CTkLabel(
-            header_frame,
-            text="SCORE",
-            font=self.get_font(16, "bold"),
-            text_color="white"
+        self._scores_tree = ttk.Treeview(
+            scores_card,
+            columns=("rank", "name", "score"),
+            show="headings",
+            height=10,
+            selectmode="none",
+            style="HighScores.Treeview"
+        )
+        self._scores_tree.heading("rank", text="RANK")
+        self._scores_tree.heading("name", text="NAME")
+        self._scores_tree.heading("score", text="SCORE")
+        self._scores_tree.column("rank", width=80, anchor=tk.W)
+        self._scores_tree.column("name", width=240, anchor=tk.W)
+        self._scores_tree.column("score", width=80, anchor=tk.E)
+
+        # Gold, silver and bronze for the top 3, alternating colors below
+        for rank, color in MEDAL_BG.items():
+            self._scores_tree.tag_configure(f"medal{rank}", background=color, foreground="black")
+        self._scores_tree.tag_configure("alternate", background=c.secondary, foreground="white")
+        self._scores_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Shown instead of the table while there are no scores
+        self._no_scores_label = ctk.CTkLabel(
+            scores_card,
+            text="No high scores yet!",
+            font=f(16, slant="italic")
         )
-        score_header.grid(row=0, column=2, padx=10, pady=10, sticky="ew")
-
-        # Scores with alternating row colors
-        top_scores = self.high_scores.get_top_scores(10)  # Show more scores
-
-        scores_list_frame = ctk.CTkScrollableFrame(scores_card, fg_color="transparent")
-        scores_list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        # Configure columns for responsiveness
-        scores_list_frame.columnconfigure(0, weight=1)
-        scores_list_frame.columnconfigure(1, weight=3)
-        scores_list_frame.columnconfigure(2, weight=1)
-
-        if not top_scores:
-            no_scores_label = ctk.CTkLabel(
-                scores_list_frame,
-                text="No high scores yet!",
-                font=self.get_font(16, slant="italic")
-            )
-            no_scores_label.grid(row=0, column=0, columnspan=3, pady=30)
-        else:
-            for i, entry in enumerate(top_scores, 1):
-                name, score = entry[0], entry[1]  
-                if i <= 3:
-                    bg_colors = {1: "#FFD700", 2: "#C0C0C0", 3: "#CD7F32"}
-                    row_color = bg_colors.get(i)
-                    text_color = "black"
-                else:
-                    # Alternating colors for other rows
-                    row_color = self.colors["secondary"] if i % 2 == 0 else None
-                    text_color = None
-
-                score_row = ctk.CTkFrame(scores_list_frame, fg_color=row_color, corner_radius=5)
-                score_row.grid(row=i-1, column=0, columnspan=3, sticky="ew", pady=3, padx=5)
-
-                score_row.columnconfigure(0, weight=1)
-                score_row.columnconfigure(1, weight=3)
-                score_row.columnconfigure(2, weight=1)
-
-                # Medal emoji for top 3
-                medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(i, f"{i}")
-
-                rank_label = ctk.CTkLabel(
-                    score_row,
-                    text=medal,
-                    font=self.get_font(14, "bold"),
-                    text_color=text_color
-                )
-                rank_label.grid(row=0, column=0, padx=10, pady=8, sticky="w")
-
-                name_label = ctk.CTkLabel(
-                    score_row,
-                    text=name,
-                    font=self.get_font(14),
-                    text_color=text_color
-                )
-                name_label.grid(row=0, column=1, padx=10, pady=8, sticky="w")
-
-                score_label = ctk.CTkLabel(
-                    score_row,
-                    text=str(score),
-                    font=self.get_font(14, "bold"),
-                    text_color=text_color
-                )
-                score_label.grid(row=0, column=2, padx=10, pady=8, sticky="e")
 
         # Back button
         button_frame = ctk.CTkFrame(scores_container, fg_color="transparent")
@@ -1438,15 +1731,66 @@ class QuizApp:
         back_button = ctk.CTkButton(
             button_frame,
             text="Back to Menu",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            command=self.show_welcome_screen
+            command=lambda: self._request_screen("welcome")
         )
         back_button.pack()
 
+    def _style_scores_table(self) -> None:
+        """Color the high scores table body for the current appearance mode."""
+        c = self.colors
+        if ctk.get_appearance_mode() == "Dark":
+            background, foreground = c.background, c.text_light
+        else:
+            background, foreground = c.text_light, c.text_dark
+        ttk.Style(self.root).configure(
+            "HighScores.Treeview",
+            background=background,
+            fieldbackground=background,
+            foreground=foreground
+        )
+
+    def _refresh_high_scores_screen(self) -> None:
+        """Fill the cached high scores table with the current top scores."""
+        # Scores are kept in memory after the first load
+        self.high_scores.ensure_loaded()
+
+        # Scores with alternating row colors
+        top_scores = self.high_scores.get_top_scores(10)  # Show more scores
+
+        # Work out each row's text and style before touching the widget, so
+        # the Tk calls below run back to back
+        rows = [
+            ((MEDAL_ICON.get(rank, f"{rank}"), name, score),
+             (f"medal{rank}",) if rank in MEDAL_BG else ("alternate",) if rank % 2 == 0 else ())
+            for rank, (name, score, *_) in enumerate(top_scores, 1)
+        ]
+
+        self._style_scores_table()
+        tree = self._scores_tree
+        tree.delete(*tree.get_children())
+
+        if not rows:
+            tree.pack_forget()
+            self._no_scores_label.pack(pady=30)
+            return
+
+        self._no_scores_label.pack_forget()
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        for values, tags in rows:
+            tree.insert("", "end", values=values, tags=tags)
+
     def show_achievements_screen(self) -> None:
         """Display the achievements screen with unlocked and locked achievements."""
-        self.clear_frame()
+        self._show_frame('achievements', self._build_achievements_screen)
+        self._refresh_achievements_screen()
+
+    def _build_achievements_screen(self) -> None:
+        """Build the achievements screen widgets into the content frame."""
+        c = self.colors
+        f = self.get_font
 
         achievements_container = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         achievements_container.pack(fill=tk.BOTH, expand=True)
@@ -1455,129 +1799,92 @@ class QuizApp:
         title_label = ctk.CTkLabel(
             achievements_container,
             text="🏆 Achievements 🏆",
-            font=self.get_font(32, "bold"),
-            text_color=self.colors["highlight"]
+            font=f(32, "bold"),
+            text_color=c.highlight
         )
         title_label.pack(pady=(30, 20))
 
-        # Define all possible achievements
-        all_achievements = [
-            {
-                "id": "perfect_easy",
-                "title": "Perfect Easy Quiz",
-                "description": "Complete an easy quiz with 100% accuracy",
-                "icon": "🎯"
-            },
-            {
-                "id": "perfect_medium",
-                "title": "Perfect Medium Quiz",
-                "description": "Complete a medium difficulty quiz with 100% accuracy",
-                "icon": "🎯"
-            },
-            {
-                "id": "perfect_hard",
-                "title": "Perfect Hard Quiz",
-                "description": "Complete a hard quiz with 100% accuracy",
-                "icon": "🎯"
-            },
-            {
-                "id": "streak_5",
-                "title": "Hot Streak",
-                "description": "Answer 5 questions correctly in a row",
-                "icon": "🔥"
-            },
-            {
-                "id": "streak_10",
-                "title": "On Fire!",
-                "description": "Answer 10 questions correctly in a row",
-                "icon": "🔥"
-            },
-            {
-                "id": "score_100",
-                "title": "Century",
-                "description": "Earn 100 points in a single quiz",
-                "icon": "💯"
-            },
-            {
-                "id": "score_200",
-                "title": "Double Century",
-                "description": "Earn 200 points in a single quiz",
-                "icon": "🌟"
-            },
-            {
-                "id": "all_categories",
-                "title": "Jack of All Trades",
-                "description": "Complete quizzes in all categories",
-                "icon": "🧠"
-            }
-        ]
-
         # Create scrollable frame for achievements
         achievements_frame = ctk.CTkScrollableFrame(
             achievements_container,
             fg_color="transparent"
         )
-        achievements_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(10, 20))
-
-        # Track row for grid layout
-        row = 0
 
-        for achievement in all_achievements:
-            # Check if achievement is unlocked
-            is_unlocked = self.achievements.get(achievement["id"], False)
-
-            # Create achievement card
-            achievement_card = ctk.CTkFrame(
-                achievements_frame,
-                fg_color=self.colors["secondary"] if is_unlocked else "#555555",
-                corner_radius=10
-            )
-            achievement_card.grid(row=row, column=0, sticky="ew", pady=5, padx=10)
-            achievement_card.columnconfigure(1, weight=1)
-
-            # Icon
-            icon_label = ctk.CTkLabel(
-                achievement_card,
-                text=achievement["icon"] if is_unlocked else "🔒",
-                font=self.get_font(24)
-            )
-            icon_label.grid(row=0, column=0, rowspan=2, padx=(15, 10), pady=10)
-
-            # Title
-            title_label = ctk.CTkLabel(
-                achievement_card,
-                text=achievement["title"],
-                font=self.get_font(16, "bold"),
-                anchor="w"
-            )
-            title_label.grid(row=0, column=1, sticky="w", padx=5, pady=(10, 0))
-
-            # Description
-            description_label = ctk.CTkLabel(
-                achievement_card,
-                text=achievement["description"],
-                font=self.get_font(12),
-                anchor="w"
-            )
-            description_label.grid(row=1, column=1, sticky="w", padx=5, pady=(0, 10))
+        # Cards start out locked; _refresh_achievements_screen applies the
+        # current unlock state on every visit
+        self._ach_widgets = []
+        self._ach_shown_unlocked = [False] * len(ALL_ACHIEVEMENTS)
+
+        with _batched(achievements_frame, fill=tk.BOTH, expand=True, padx=30, pady=(10, 20)):
+            for row, achievement in enumerate(ALL_ACHIEVEMENTS):
+                # Create achievement card
+                achievement_card = ctk.CTkFrame(
+                    achievements_frame,
+                    fg_color="#555555",
+                    corner_radius=10
+                )
+                achievement_card.grid(row=row, column=0, sticky="ew", pady=5, padx=10)
+                achievement_card.columnconfigure(1, weight=1)
+
+                # Icon
+                icon_label = ctk.CTkLabel(
+                    achievement_card,
+                    text="🔒",
+                    font=f(24)
+                )
+                icon_label.grid(row=0, column=0, rowspan=2, padx=(15, 10), pady=10)
+
+                # Title
+                title_label = ctk.CTkLabel(
+                    achievement_card,
+                    text=achievement.title,
+                    font=f(16, "bold"),
+                    anchor="w"
+                )
+                title_label.grid(row=0, column=1, sticky="w", padx=5, pady=(10, 0))
+
+                # Description
+                description_label = ctk.CTkLabel(
+                    achievement_card,
+                    text=achievement.description,
+                    font=f(12),
+                    anchor="w"
+                )
+                description_label.grid(row=1, column=1, sticky="w", padx=5, pady=(0, 10))
 
-            # Status indicator
-            status_label = ctk.CTkLabel(
-                achievement_card,
-                text="UNLOCKED" if is_unlocked else "LOCKED",
-                font=self.get_font(12, "bold"),
-                text_color=self.colors["highlight"] if is_unlocked else None
-            )
-            status_label.grid(row=0, column=2, rowspan=2, padx=15, pady=10)
+                # Status indicator
+                status_label = ctk.CTkLabel(
+                    achievement_card,
+                    text="LOCKED",
+                    font=f(12, "bold")
+                )
+                status_label.grid(row=0, column=2, rowspan=2, padx=15, pady=10)
+                self._ach_status_text_color = status_label.cget("text_color")
 
-            row += 1
+                self._ach_widgets.append((achievement, achievement_card, icon_label, status_label))
 
         # Back button
         back_button = ctk.CTkButton(
             achievements_container,
             text="Back to Menu",
-            font=self.get_font(16),
+            font=f(16),
             width=150,
-            command=self.show_welcome_screen
+            command=lambda: self._request_screen("welcome")
         )
         back_button.pack(pady=20)
+
+    def _refresh_achievements_screen(self) -> None:
+        """Update the cached achievement cards whose unlock state has changed."""
+        shown = self._ach_shown_unlocked
+        for i, (achievement, card, icon_label, status_label) in enumerate(self._ach_widgets):
+            is_unlocked = self.achievements.get(achievement.id, False)
+            if is_unlocked == shown[i]:
+                continue
+            shown[i] = is_unlocked
+
+            card.configure(fg_color=self.colors.secondary if is_unlocked else "#555555")
+            icon_label.configure(text=achievement.icon if is_unlocked else "🔒")
+            status_label.configure(
+                text="UNLOCKED" if is_unlocked else "LOCKED",
+                text_color=self.colors.highlight if is_unlocked else self._ach_status_text_color
+            )
@@ -1,7 +1,46 @@
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Set, NamedTuple
 import os
 import json
+import atexit
+import heapq
+import weakref
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime
+from operator import attrgetter, itemgetter
+
+try:
+    # Optional: orjson reads and writes the player stats much faster
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# HighScores instances still alive; flushed once when the interpreter exits
+_live_instances: "weakref.WeakSet" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_stats_at_exit() -> None:
+    """
+    Write out unsaved player statistics when the interpreter exits.
+    
+    Returns:
+        None
+    """
+    for high_scores in list(_live_instances):
+        high_scores.flush_stats()
+
+
+class ScoreEntry(NamedTuple):
+    """
+    One high score. Being a tuple, it has no per-instance __dict__ and
+    still compares, unpacks and indexes like the plain tuples used before.
+    """
+    name: str
+    score: int
+    date: str
+    category: str
+    difficulty: str
 
 
 class HighScores:
@@ -15,20 +54,60 @@ class HighScores:
     - Generating leaderboards for different categories and difficulties
     """
     
-    def __init__(self, file_path: str = "high_scores.txt", stats_file: str = "player_stats.json"):
+    # Metrics with a leaderboard kept sorted as player stats change
+    RANKED_METRICS = ("highest_score", "average_score", "games_played")
+    
+    # Player stat fields held as sets in memory and saved as JSON lists
+    SET_FIELDS = ("achievements", "categories_played", "difficulties_completed")
+    
+    def __init__(self, file_path: str = "high_scores.txt", stats_file: str = "player_stats.json",
+                 max_scores: int = 100):
         """
         Initialize the high scores manager with the path to the scores file.
         
         Args:
             file_path: Path to the text file containing high scores
             stats_file: Path to the JSON file containing player statistics
+            max_scores: Maximum number of scores to keep in the overall list and in
+                each category/difficulty view; scores in none of them are dropped
         """
         self.file_path = file_path
         self.stats_file = stats_file
+        self.max_scores = max_scores
+        # Invariant: kept sorted by score in descending order, at most max_scores
         self.scores = []
+        # Negated scores parallel to self.scores, ascending, for bisect
+        self._score_keys: List[int] = []
+        # Filtered views of self.scores keyed by (category, difficulty), with
+        # "all" as a wildcard, each holding (negated scores, entries) lists
+        # in the same order as self.scores; each is capped at max_scores on its own
+        self._buckets: Dict[Tuple[str, str], Tuple[List[int], List[ScoreEntry]]] = {}
+        # Every entry still in self.scores or a bucket, i.e. what the file
+        # has to keep, keyed by id() in insertion order, with the number of
+        # views holding it
+        self._retained: Dict[int, List[Any]] = {}
+        # Fifth best score, or None while fewer than five scores exist
+        self._threshold: Optional[int] = None
+        # True until the scores file has been read; save_score keeps the
+        # in-memory list current, so it never needs reading again after that
+        self._dirty = True
+        # Lines currently in the scores file; new scores are appended and the
+        # file is only rewritten once stale lines outnumber the kept ones
+        self._file_lines = 0
+        self._rewrite_needed = False
         self.player_stats = {}
+        # Leaderboards computed since player_stats last changed, keyed by
+        # (metric, limit); bump _cache_version whenever player_stats changes
+        self._cache_version = 0
+        self._leaderboard_cache: Dict[Tuple[str, int], List[Tuple[str, Any]]] = {}
+        self._leaderboard_cache_version = 0
+        # Per-metric (-value, name) lists kept in ascending order, i.e. best first
+        self._leaderboards: Dict[str, List[Tuple[Any, str]]] = {}
+        # Player stats changed since they were last written to disk
+        self._stats_dirty = False
         self.load_scores()
         self.load_stats()
+        _live_instances.add(self)
     
     def load_scores(self) -> None:
         """
@@ -41,36 +120,102 @@ class HighScores:
             None
         """
         self.scores = []
+        self._score_keys = []
+        self._buckets = {}
+        self._retained = {}
+        self._threshold = None
+        self._dirty = False
+        self._file_lines = 0
+        self._rewrite_needed = False
         
         if not os.path.exists(self.file_path):
             return
             
         try:
             with open(self.file_path, 'r') as file:
-                for line in file:
-                    line = line.strip()
-                    if line and ',' in line:
-                        parts = line.split(',')
-                        if len(parts) >= 4:  # Extended format with metadata
-                            name, score_str, date_str, category = parts[:4]
-                            difficulty = parts[4] if len(parts) > 4 else "all"
-                        else:  # Legacy format
-                            name, score_str = parts[:2]
-                            date_str = "Unknown"
-                            category = "all"
-                            difficulty = "all"
-                            
-                        try:
-                            score = int(score_str)
-                            entry = (name, score, date_str, category, difficulty)
-                            self.scores.append(entry)
-                        except ValueError:
-                            continue
+                raw = file.read()
         except Exception as e:
             print(f"Error loading high scores: {e}")
+            raw = ""
+            self._rewrite_needed = True
+            
+        lines = raw.splitlines()
+        self._file_lines = len(lines)
+        # Appending to a file without a final newline would join two lines
+        if raw and not raw.endswith("\n"):
+            self._rewrite_needed = True
+            
+        loaded = []
+        # The writer never quotes fields, so plain splitting matches it exactly
+        for line in lines:
+            parts = line.strip().split(',')
+            if len(parts) < 2:
+                continue
+                
+            if len(parts) >= 4:  # Extended format with metadata
+                name, score_str, date_str, category = parts[:4]
+                difficulty = parts[4] if len(parts) > 4 else "all"
+            else:  # Legacy format
+                name, score_str = parts[:2]
+                date_str = "Unknown"
+                category = "all"
+                difficulty = "all"
+                
+            # Scores are never negative, so isdecimal() is enough to skip bad
+            # lines; unlike isdigit() it rejects characters such as '²' that
+            # int() can't parse
+            if score_str.isdecimal():
+                loaded.append(ScoreEntry(name, int(score_str), date_str, category, difficulty))
             
-        # Sort scores by score value (descending)
-        self.scores.sort(key=lambda x: x[1], reverse=True)
+        # Go through the scores best first (ties keep file order), so every
+        # view can simply be appended to until it is full
+        loaded.sort(key=attrgetter("score"), reverse=True)
+        for entry in loaded:
+            key = -entry.score
+            views = 0
+            if len(self.scores) < self.max_scores:
+                self._score_keys.append(key)
+                self.scores.append(entry)
+                views += 1
+            for bucket_key in self._bucket_keys(entry):
+                keys, entries = self._buckets.setdefault(bucket_key, ([], []))
+                if len(entries) < self.max_scores:
+                    keys.append(key)
+                    entries.append(entry)
+                    views += 1
+            if views:
+                self._retained[id(entry)] = [entry, views]
+                
+        self._update_threshold()
+    
+    @staticmethod
+    def _bucket_keys(entry: ScoreEntry) -> Set[Tuple[str, str]]:
+        """
+        Get the filtered views a score entry belongs to.
+        
+        The unfiltered ("all", "all") view is self.scores itself and is
+        never included.
+        
+        Args:
+            entry: The score entry
+            
+        Returns:
+            Set of (category, difficulty) bucket keys
+        """
+        category, difficulty = entry.category, entry.difficulty
+        keys = {(category, difficulty), (category, "all"), ("all", difficulty)}
+        keys.discard(("all", "all"))
+        return keys
+    
+    def ensure_loaded(self) -> None:
+        """
+        Load high scores from the file unless they are already in memory.
+        
+        Returns:
+            None
+        """
+        if self._dirty:
+            self.load_scores()
     
     def save_score(self, name: str, score: int, stats: Dict[str, Any] = None) -> None:
         """
@@ -96,24 +241,115 @@ class HighScores:
             category = stats.get("category", "all")
             difficulty = stats.get("difficulty", "all")
             
-        # Add to scores list
-        entry = (name, score, date_str, category, difficulty)
-        self.scores.append(entry)
-        self.scores.sort(key=lambda x: x[1], reverse=True)
+        # Insert into the sorted list, dropping whatever falls below the cap.
+        # A score that did not make the cut leaves the file untouched.
+        entry = ScoreEntry(name, score, date_str, category, difficulty)
+        if self._insert_score(entry):
+            if self._rewrite_needed or self._file_lines >= 2 * len(self._retained):
+                self._compact_scores_file()
+            else:
+                self._append_score_line(entry)
+            
+        # Update player statistics
+        self.update_player_stats(name, score, stats)
+    
+    def _append_score_line(self, entry: ScoreEntry) -> None:
+        """
+        Append a single score line to the end of the high scores file.
         
+        Args:
+            entry: The score entry
+            
+        Returns:
+            None
+        """
         try:
-            with open(self.file_path, 'w') as file:
-                for entry in self.scores:
-                    # Save extended format with metadata
-                    file.write(f"{entry[0]},{entry[1]},{entry[2]},{entry[3]},{entry[4]}\n")
+            with open(self.file_path, 'a') as file:
+                file.write("{},{},{},{},{}\n".format(*entry))
+            self._file_lines += 1
         except Exception as e:
             print(f"Error saving high scores: {e}")
             
-        # Update player statistics
-        self.update_player_stats(name, score, stats)
+    def _compact_scores_file(self) -> None:
+        """
+        Rewrite the high scores file so it only holds the retained scores.
+        
+        Returns:
+            None
+        """
+        try:
+            # Save extended format with metadata in a single write, going
+            # through a temporary file so a crash never leaves a partial file
+            retained = sorted((entry for entry, _ in self._retained.values()),
+                              key=attrgetter("score"), reverse=True)
+            data = "".join(f"{n},{s},{d},{c},{f}\n" for n, s, d, c, f in retained)
+            tmp_path = self.file_path + ".tmp"
+            with open(tmp_path, 'w', buffering=1 << 16) as file:
+                file.write(data)
+            os.replace(tmp_path, self.file_path)
+            self._file_lines = len(retained)
+            self._rewrite_needed = False
+        except Exception as e:
+            print(f"Error saving high scores: {e}")
+            
+    def _insert_score(self, entry: ScoreEntry) -> bool:
+        """
+        Insert an entry into the sorted scores list and the buckets it belongs
+        to, each of which keeps at most max_scores entries.
+        
+        Equal scores keep their insertion order, so older entries rank first.
+        
+        Args:
+            entry: The score entry
+            
+        Returns:
+            True if the entry was kept in any of them, False otherwise
+        """
+        views = self._insert_into_view(self._score_keys, self.scores, entry)
+        for bucket_key in self._bucket_keys(entry):
+            keys, entries = self._buckets.setdefault(bucket_key, ([], []))
+            views += self._insert_into_view(keys, entries, entry)
+            
+        if not views:
+            return False
+        self._retained[id(entry)] = [entry, views]
+        self._update_threshold()
+        return True
+    
+    def _insert_into_view(self, keys: List[int], entries: List[ScoreEntry],
+                          entry: ScoreEntry) -> bool:
+        """
+        Insert an entry into one sorted view unless it falls below the cap.
+        
+        An entry pushed out of its last view is forgotten entirely, so the
+        next compaction drops it from the file.
+        
+        Args:
+            keys: Negated scores of the view, ascending
+            entries: Entries of the view, parallel to keys
+            entry: The score entry
+            
+        Returns:
+            True if the entry was inserted, False otherwise
+        """
+        key = -entry.score
+        pos = bisect_right(keys, key)
+        if pos >= self.max_scores:
+            return False
+            
+        keys.insert(pos, key)
+        entries.insert(pos, entry)
+        if len(entries) > self.max_scores:
+            keys.pop()
+            evicted = entries.pop()
+            retained = self._retained[id(evicted)]
+            retained[1] -= 1
+            if not retained[1]:
+                del self._retained[id(evicted)]
+        return True
     
     def get_top_scores(self, limit: int = 5, category: str = "all", 
-               difficulty: str = "all") -> List[Tuple]:
+               difficulty: str = "all") -> List[ScoreEntry]:
         """
         Get the top scores, optionally filtered by category and difficulty.
         
@@ -123,21 +359,39 @@ class HighScores:
             difficulty: Difficulty to filter by, or "all" for unfiltered
             
         Returns:
-            List of (name, score, date, category, difficulty) tuples for the top scores
+            List of ScoreEntry tuples for the top scores
         """
-        filtered_scores = self.scores
-        
-        # Filter by category if specified
-        if category != "all":
-            filtered_scores = [s for s in filtered_scores if s[3] == category]
+        if category == "all" and difficulty == "all":
+            return self.scores[:limit]
             
-        # Filter by difficulty if specified
-        if difficulty != "all":
-            filtered_scores = [s for s in filtered_scores if s[4] == difficulty]
-            
-        # Return sorted, limited list
-        return sorted(filtered_scores, key=lambda x: x[1], reverse=True)[:limit]
+        # Filtered queries read the matching pre-sorted bucket
+        bucket = self._buckets.get((category, difficulty))
+        return bucket[1][:limit] if bucket else []
     
+    def _update_threshold(self) -> None:
+        """
+        Cache the score a new entry has to beat to make the unfiltered top five.
+        
+        Must be called whenever self.scores changes.
+        
+        Returns:
+            None
+        """
+        rank = self._high_score_rank()
+        self._threshold = self.scores[rank - 1].score if len(self.scores) >= rank else None
+        
+    def _high_score_rank(self) -> int:
+        """
+        Get the number of places that count as a high score in each view.
+        
+        This is the top five, unless fewer scores are kept per view, so
+        every score that qualifies is also kept by save_score.
+        
+        Returns:
+            Number of high score places
+        """
+        return min(5, self.max_scores)
+        
     def is_high_score(self, score: int, category: str = "all", 
                      difficulty: str = "all") -> bool:
         """
@@ -152,13 +406,18 @@ class HighScores:
         Returns:
             True if the score is a high score, False otherwise
         """
-        top_scores = self.get_top_scores(5, category, difficulty)
-        
-        if len(top_scores) < 5:
+        # Unfiltered check uses the cached fifth best score
+        if category == "all" and difficulty == "all":
+            return self._threshold is None or score > self._threshold
+            
+        # Buckets are sorted, so the entry at rank - 1 is the lowest one that
+        # counts as a high score
+        bucket = self._buckets.get((category, difficulty))
+        rank = self._high_score_rank()
+        if bucket is None or len(bucket[1]) < rank:
             return True
             
-        # Extract the score value (index 1) from each tuple
-        return score > min(entry[1] for entry in top_scores)
+        return score > bucket[1][rank - 1].score
         
     def load_stats(self) -> None:
         """
@@ -167,16 +426,78 @@ class HighScores:
         Returns:
             None
         """
+        self._cache_version += 1
+        self._stats_dirty = False
+        
         if not os.path.exists(self.stats_file):
             self.player_stats = {}
+            self._rebuild_leaderboards()
             return
             
         try:
             with open(self.stats_file, 'r') as file:
-                self.player_stats = json.load(file)
+                raw = file.read()
+            self.player_stats = orjson.loads(raw) if orjson else json.loads(raw)
+            
+            # Sets make the "already recorded?" checks constant time
+            for stats in self.player_stats.values():
+                for field in self.SET_FIELDS:
+                    if field in stats:
+                        stats[field] = set(stats[field])
+                        
+            # Ranking fails on malformed metric values, so it counts as loading
+            self._rebuild_leaderboards()
         except Exception as e:
             print(f"Error loading player stats: {e}")
             self.player_stats = {}
+            self._rebuild_leaderboards()
+        
+    def _rebuild_leaderboards(self) -> None:
+        """
+        Rank every player for each of RANKED_METRICS from scratch.
+        
+        Returns:
+            None
+        """
+        self._leaderboards = {
+            metric: sorted((-stats[metric], name)
+                           for name, stats in self.player_stats.items() if metric in stats)
+            for metric in self.RANKED_METRICS
+        }
+        
+    def _unrank_player(self, name: str) -> None:
+        """
+        Remove a player's current entries from the ranked leaderboards.
+        
+        Args:
+            name: Player's name
+            
+        Returns:
+            None
+        """
+        stats = self.player_stats.get(name, {})
+        for metric, ranked in self._leaderboards.items():
+            if metric not in stats:
+                continue
+            item = (-stats[metric], name)
+            pos = bisect_left(ranked, item)
+            if pos < len(ranked) and ranked[pos] == item:
+                del ranked[pos]
+                
+    def _rank_player(self, name: str) -> None:
+        """
+        Insert a player's current entries into the ranked leaderboards.
+        
+        Args:
+            name: Player's name
+            
+        Returns:
+            None
+        """
+        stats = self.player_stats[name]
+        for metric, ranked in self._leaderboards.items():
+            if metric in stats:
+                insort(ranked, (-stats[metric], name))
             
     def update_player_stats(self, name: str, score: int, game_stats: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -190,6 +511,9 @@ class HighScores:
         Returns:
             None
         """
+        # Take the player out of the rankings while their stats change
+        self._unrank_player(name)
+        
         if name not in self.player_stats:
             self.player_stats[name] = {
                 "total_score": 0,
@@ -199,9 +523,9 @@ class HighScores:
                 "questions_answered": 0,
                 "correct_answers": 0,
                 "last_played": "",
-                "achievements": [],
-                "categories_played": [],
-                "difficulties_completed": []
+                "achievements": set(),
+                "categories_played": set(),
+                "difficulties_completed": set()
             }
             
         player = self.player_stats[name]
@@ -217,20 +541,23 @@ class HighScores:
             
             # Update categories played
             category = game_stats.get("category", "")
-            if category and category != "all" and category not in player["categories_played"]:
-                player["categories_played"].append(category)
+            if category and category != "all":
+                player["categories_played"].add(category)
                 
             # Update completed difficulties
             difficulty = game_stats.get("difficulty", "")
-            if difficulty and difficulty != "all" and difficulty not in player["difficulties_completed"]:
-                player["difficulties_completed"].append(difficulty)
+            if difficulty and difficulty != "all":
+                player["difficulties_completed"].add(difficulty)
                 
         # Recalculate average score
         if player["games_played"] > 0:
             player["average_score"] = player["total_score"] / player["games_played"]
             
-        # Save updated stats
-        self.save_stats()
+        self._rank_player(name)
+        self._cache_version += 1
+        
+        # Written out by flush_stats, at the latest when the program exits
+        self._stats_dirty = True
         
     def save_stats(self) -> None:
         """
@@ -239,12 +566,35 @@ class HighScores:
         Returns:
             None
         """
+        # JSON has no sets, so those fields are written as sorted lists
+        data = {
+            name: {key: sorted(value) if isinstance(value, set) else value
+                   for key, value in stats.items()}
+            for name, stats in self.player_stats.items()
+        }
+        
         try:
-            with open(self.stats_file, 'w') as file:
-                json.dump(self.player_stats, file, indent=2)
+            if orjson:
+                with open(self.stats_file, 'wb') as file:
+                    file.write(orjson.dumps(data))
+            else:
+                # Compact separators keep the file as small as orjson's output
+                with open(self.stats_file, 'w') as file:
+                    json.dump(data, file, separators=(",", ":"))
+            self._stats_dirty = False
         except Exception as e:
             print(f"Error saving player stats: {e}")
             
+    def flush_stats(self) -> None:
+        """
+        Save player statistics if they changed since the last save.
+        
+        Returns:
+            None
+        """
+        if self._stats_dirty:
+            self.save_stats()
+            
     def get_player_stats(self, name: str) -> Dict[str, Any]:
         """
         Get statistics for a specific player.
@@ -265,17 +615,43 @@ class HighScores:
             metric: Statistic to rank by (highest_score, average_score, games_played)
             limit: Number of entries to return
             
+        Returns:
+            List of (name, value) tuples sorted by the metric
+        """
+        # Common metrics are kept ranked, so only the top entries are read
+        ranked = self._leaderboards.get(metric)
+        if ranked is not None:
+            return [(name, -value) for value, name in ranked[:limit]]
+            
+        if self._leaderboard_cache_version != self._cache_version:
+            self._leaderboard_cache.clear()
+            self._leaderboard_cache_version = self._cache_version
+            
+        key = (metric, limit)
+        leaderboard = self._leaderboard_cache.get(key)
+        if leaderboard is None:
+            leaderboard = self._build_leaderboard(metric, limit)
+            self._leaderboard_cache[key] = leaderboard
+            
+        # Callers get their own copy so the cached list cannot be modified
+        return list(leaderboard)
+        
+    def _build_leaderboard(self, metric: str, limit: int) -> List[Tuple[str, Any]]:
+        """
+        Rank all players by a metric.
+        
+        Args:
+            metric: Statistic to rank by
+            limit: Number of entries to return
+            
         Returns:
             List of (name, value) tuples sorted by the metric
         """
         if not self.player_stats:
             return []
             
-        leaderboard = []
-        for name, stats in self.player_stats.items():
-            if metric in stats:
-                leaderboard.append((name, stats[metric]))
+        leaderboard = ((name, stats[metric])
+                       for name, stats in self.player_stats.items() if metric in stats)
                 
-        # Sort by the selected metric (descending)
-        leaderboard.sort(key=lambda x: x[1], reverse=True)
-        return leaderboard[:limit]
+        # Select the top entries by the metric (descending) without a full sort
+        return heapq.nlargest(limit, leaderboard, key=itemgetter(1))
@@ -5,7 +5,181 @@ This module provides translation functionality for the application,
 supporting multiple languages including Arabic.
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+
+
+# English translations, always loaded as the default language
+_EN_TRANSLATIONS: Dict[str, str] = {
+    # General
+    "app_title": "Quiz Master",
+    "loading": "Loading...",
+    "version": "Version",
+    
+    # Welcome screen
+    "welcome_subtitle": "Test your knowledge and compete for high scores!",
+    "num_questions": "Number of Questions:",
+    "difficulty_level": "Difficulty Level:",
+    "category": "Category:",
+    "timer_seconds": "Timer (seconds):",
+    "theme": "Theme:",
+    "start_quiz": "Start Quiz",
+    "view_high_scores": "View High Scores",
+    "achievements": "Achievements",
+    
+    # Difficulty levels
+    "all": "All",
+    "easy": "Easy",
+    "medium": "Medium",
+    "hard": "Hard",
+    
+    # Theme options
+    "light": "Light",
+    "dark": "Dark",
+    "system": "System",
+    
+    # Question screen
+    "question_of": "Question {current} of {total}",
+    "streak": "Streak: {streak}",
+    "score": "Score: {score}",
+    "seconds_remaining": "seconds remaining",
+    "submit_answer": "Submit Answer",
+    "use_hint": "Use Hint (-5 pts)",
+    "skip_question": "Skip Question",
+    "times_up": "Time's Up!",
+    
+    # Results screen
+    "quiz_completed": "Quiz Completed!",
+    "final_score": "Final Score: {score}",
+    "correct_answers": "Correct Answers: {correct}/{total}",
+    "accuracy": "Accuracy: {accuracy}%",
+    "avg_time": "Average Time: {time} seconds",
+    "longest_streak": "Longest Streak: {streak}",
+    "new_high_score": "New High Score!",
+    "enter_name": "Enter your name:",
+    "save_score": "Save Score",
+    "play_again": "Play Again",
+    "high_scores": "High Scores",
+    
+    # High scores screen
+    "high_scores_title": "High Scores",
+    "rank": "Rank",
+    "name": "Name",
+    "score_header": "Score",
+    "no_scores": "No high scores yet!",
+    "back_to_menu": "Back to Menu",
+    
+    # Error messages
+    "error": "Error",
+    "no_questions": "No questions available for the selected criteria.",
+    
+    # Language
+    "language": "Language:",
+}
+
+
+def _load_arabic_translations() -> Dict[str, str]:
+    """
+    Build the Arabic translations.
+
+    Only called the first time Arabic is selected, so English-only
+    sessions never build this table.
+
+    Returns:
+        Dictionary of Arabic translations
+    """
+    return {
+        # General - Arabic translations
+        "app_title": "سيد الاختبار",
+        "loading": "جاري التحميل...",
+        "version": "الإصدار",
+        
+        # Welcome screen
+        "welcome_subtitle": "اختبر معلوماتك وتنافس على أعلى الدرجات!",
+        "num_questions": "عدد الأسئلة:",
+        "difficulty_level": "مستوى الصعوبة:",
+        "category": "الفئة:",
+        "timer_seconds": "المؤقت (ثواني):",
+        "theme": "المظهر:",
+        "start_quiz": "ابدأ الاختبار",
+        "view_high_scores": "عرض أعلى الدرجات",
+        "achievements": "الإنجازات",
+        
+        # Difficulty levels
+        "all": "الكل",
+        "easy": "سهل",
+        "medium": "متوسط",
+        "hard": "صعب",
+        
+        # Theme options
+        "light": "فاتح",
+        "dark": "داكن",
+        "system": "النظام",
+        
+        # Question screen
+        "question_of": "سؤال {current} من {total}",
+        "streak": "التتابع: {streak}",
+        "score": "النتيجة: {score}",
+        "seconds_remaining": "ثواني متبقية",
+        "submit_answer": "إرسال الإجابة",
+        "use_hint": "استخدم تلميح (-5 نقاط)",
+        "skip_question": "تخطي السؤال",
+        "times_up": "انتهى الوقت!",
+        
+        # Results screen
+        "quiz_completed": "اكتمل الاختبار!",
+        "final_score": "النتيجة النهائية: {score}",
+        "correct_answers": "الإجابات الصحيحة: {correct}/{total}",
+        "accuracy": "الدقة: {accuracy}%",
+        "avg_time": "متوسط الوقت: {time} ثانية",
+        "longest_streak": "أطول تتابع: {streak}",
+        "new_high_score": "نتيجة عالية جديدة!",
+        "enter_name": "أدخل اسمك:",
+        "save_score": "حفظ النتيجة",
+        "play_again": "العب مرة أخرى",
+        "high_scores": "أعلى الدرجات",
+        
+        # High scores screen
+        "high_scores_title": "أعلى الدرجات",
+        "rank": "الترتيب",
+        "name": "الاسم",
+        "score_header": "النتيجة",
+        "no_scores": "لا توجد درجات عالية حتى الآن!",
+        "back_to_menu": "العودة إلى القائمة",
+        
+        # Error messages
+        "error": "خطأ",
+        "no_questions": "لا توجد أسئلة متاحة للمعايير المحددة.",
+        
+        # Language
+        "language": "اللغة:",
+    }
+
+
+# Builders for languages whose translations are loaded on first use
+_TRANSLATION_LOADERS: Dict[str, Callable[[], Dict[str, str]]] = {
+    "ar": _load_arabic_translations,
+}
+
+# Translations loaded so far, shared by all Localization instances
+_TRANSLATIONS: Dict[str, Dict[str, str]] = {"en": _EN_TRANSLATIONS}
+
+
+def _get_translations(language: str) -> Dict[str, str]:
+    """
+    Get the translations for a language, loading them on first use.
+
+    Args:
+        language: The language code
+
+    Returns:
+        Dictionary of translations, empty if the language has none
+    """
+    translations = _TRANSLATIONS.get(language)
+    if translations is None:
+        loader = _TRANSLATION_LOADERS.get(language)
+        translations = loader() if loader else {}
+        _TRANSLATIONS[language] = translations
+    return translations
 
 
 class Localization:
@@ -33,153 +207,9 @@ class Localization:
             language: The language code to use (default: English)
         """
         self.current_language = language if language in self.LANGUAGES else self.DEFAULT_LANGUAGE
-        self._translations = self._load_translations()
-        
-    def _load_translations(self) -> Dict[str, Dict[str, str]]:
-        """
-        Load all translations for supported languages.
+        # Table for the current language, rebound whenever the language changes
+        self._active_translations = _get_translations(self.current_language)
         
-        Returns:
-            Dictionary of translations for all supported languages
-        """
-        translations = {
-            "en": {
-                # General
-                "app_title": "Quiz Master",
-                "loading": "Loading...",
-                "version": "Version",
-                
-                # Welcome screen
-                "welcome_subtitle": "Test your knowledge and compete for high scores!",
-                "num_questions": "Number of Questions:",
-                "difficulty_level": "Difficulty Level:",
-                "category": "Category:",
-                "timer_seconds": "Timer (seconds):",
-                "theme": "Theme:",
-                "start_quiz": "Start Quiz",
-                "view_high_scores": "View High Scores",
-                "achievements": "Achievements",
-                
-                # Difficulty levels
-                "all": "All",
-                "easy": "Easy",
-                "medium": "Medium",
-                "hard": "Hard",
-                
-                # Theme options
-                "light": "Light",
-                "dark": "Dark",
-                "system": "System",
-                
-                # Question screen
-                "question_of": "Question {current} of {total}",
-                "streak": "Streak: {streak}",
-                "score": "Score: {score}",
-                "seconds_remaining": "seconds remaining",
-                "submit_answer": "Submit Answer",
-                "use_hint": "Use Hint (-5 pts)",
-                "skip_question": "Skip Question",
-                "times_up": "Time's Up!",
-                
-                # Results screen
-                "quiz_completed": "Quiz Completed!",
-                "final_score": "Final Score: {score}",
-                "correct_answers": "Correct Answers: {correct}/{total}",
-                "accuracy": "Accuracy: {accuracy}%",
-                "avg_time": "Average Time: {time} seconds",
-                "longest_streak": "Longest Streak: {streak}",
-                "new_high_score": "New High Score!",
-                "enter_name": "Enter your name:",
-                "save_score": "Save Score",
-                "play_again": "Play Again",
-                "high_scores": "High Scores",
-                
-                # High scores screen
-                "high_scores_title": "High Scores",
-                "rank": "Rank",
-                "name": "Name",
-                "score_header": "Score",
-                "no_scores": "No high scores yet!",
-                "back_to_menu": "Back to Menu",
-                
-                # Error messages
-                "error": "Error",
-                "no_questions": "No questions available for the selected criteria.",
-                
-                # Language
-                "language": "Language:",
-            },
-            
-            "ar": {
-                # General - Arabic translations
-                "app_title": "سيد الاختبار",
-                "loading": "جاري التحميل...",
-                "version": "الإصدار",
-                
-                # Welcome screen
-                "welcome_subtitle": "اختبر معلوماتك وتنافس على أعلى الدرجات!",
-                "num_questions": "عدد الأسئلة:",
-                "difficulty_level": "مستوى الصعوبة:",
-                "category": "الفئة:",
-                "timer_seconds": "المؤقت (ثواني):",
-                "theme": "المظهر:",
-                "start_quiz": "ابدأ الاختبار",
-                "view_high_scores": "عرض أعلى الدرجات",
-                "achievements": "الإنجازات",
-                
-                # Difficulty levels
-                "all": "الكل",
-                "easy": "سهل",
-                "medium": "متوسط",
-                "hard": "صعب",
-                
-                # Theme options
-                "light": "فاتح",
-                "dark": "داكن",
-                "system": "النظام",
-                
-                # Question screen
-                "question_of": "سؤال {current} من {total}",
-                "streak": "التتابع: {streak}",
-                "score": "النتيجة: {score}",
-                "seconds_remaining": "ثواني متبقية",
-                "submit_answer": "إرسال الإجابة",
-                "use_hint": "استخدم تلميح (-5 نقاط)",
-                "skip_question": "تخطي السؤال",
-                "times_up": "انتهى الوقت!",
-                
-                # Results screen
-                "quiz_completed": "اكتمل الاختبار!",
-                "final_score": "النتيجة النهائية: {score}",
-                "correct_answers": "الإجابات الصحيحة: {correct}/{total}",
-                "accuracy": "الدقة: {accuracy}%",
-                "avg_time": "متوسط الوقت: {time} ثانية",
-                "longest_streak": "أطول تتابع: {streak}",
-                "new_high_score": "نتيجة عالية جديدة!",
-                "enter_name": "أدخل اسمك:",
-                "save_score": "حفظ النتيجة",
-                "play_again": "العب مرة أخرى",
-                "high_scores": "أعلى الدرجات",
-                
-                # High scores screen
-                "high_scores_title": "أعلى الدرجات",
-                "rank": "الترتيب",
-                "name": "الاسم",
-                "score_header": "النتيجة",
-                "no_scores": "لا توجد درجات عالية حتى الآن!",
-                "back_to_menu": "العودة إلى القائمة",
-                
-                # Error messages
-                "error": "خطأ",
-                "no_questions": "لا توجد أسئلة متاحة للمعايير المحددة.",
-                
-                # Language
-                "language": "اللغة:",
-            }
-        }
-        
-        return translations
-    
     def get_text(self, key: str, **kwargs) -> str:
         """
         Get translated text for the given key.
@@ -191,11 +221,8 @@ class Localization:
         Returns:
             Translated text, or the key itself if translation not found
         """
-        # Get the translation dictionary for the current language
-        translations = self._translations.get(self.current_language, {})
-        
         # Get the translated text or fall back to the key itself
-        text = translations.get(key, key)
+        text = self._active_translations.get(key, key)
         
         # Apply formatting if kwargs are provided
         if kwargs:
@@ -218,6 +245,7 @@ class Localization:
         """
         if language in self.LANGUAGES:
             self.current_language = language
+            self._active_translations = _get_translations(language)
             return True
         return False
     
@@ -1,8 +1,78 @@
 import json
+import os
+import pickle
 import random
+import sys
 import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Set
+from itertools import chain
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Set
+
+try:
+    # Optional: orjson parses and writes large question banks several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional: ijson streams very large question banks instead of
+    # reading the whole file into memory first
+    import ijson
+except ImportError:
+    ijson = None
+
+# Parse errors raised while streaming; orjson's errors already subclass
+# json.JSONDecodeError
+_STREAM_ERRORS: Tuple[type, ...] = (ijson.JSONError,) if ijson else ()
+
+
+def _shuffle_prefix(items: List[Any], count: int, start: int = 0) -> None:
+    """
+    Shuffle items in place so that the `count` slots from `start` hold a
+    uniform random selection of items[start:] in random order (a partial
+    Fisher-Yates shuffle).
+
+    Slot indices come from one 64-bit random number each, scaled into
+    range with a multiply and shift (Lemire's method). This is cheaper
+    than randrange, and the bias it introduces is at most n / 2**64.
+
+    Args:
+        items: List to shuffle in place
+        count: Number of slots to fill; len(items) shuffles everything
+        start: First slot to fill; earlier slots are left alone
+
+    Returns:
+        None
+    """
+    getrandbits = random.getrandbits
+    n = len(items)
+    for i in range(start, min(start + count, n - 1)):
+        j = i + ((getrandbits(64) * (n - i)) >> 64)
+        items[i], items[j] = items[j], items[i]
+
+
+class Question(dict):
+    """
+    A question from the question bank.
+
+    Behaves exactly like the question's dictionary, so it can still be
+    read, updated and saved as JSON. The base points for its difficulty
+    are worked out once when it is created and kept in a slot.
+    """
+
+    __slots__ = ("points",)
+
+    def __init__(self, data: Dict[str, Any], points: int):
+        """
+        Create a question from its JSON data.
+
+        Args:
+            data: The question's fields
+            points: Base points awarded for answering it correctly
+        """
+        super().__init__(data)
+        self.points = points
 
 
 class QuizLogic:
@@ -17,6 +87,20 @@ class QuizLogic:
     - Tracking statistics including streak, accuracy, and timing
     """
 
+    # Base points for a correct answer by difficulty; unknown ones score 10
+    _POINTS: Dict[str, int] = {"easy": 10, "medium": 15, "hard": 20}
+
+    # Time bonus for a correct answer: _TIME_BONUS[i] applies to answers
+    # taken before _TIME_BONUS_LIMITS_NS[i]; slower answers get the last entry
+    _TIME_BONUS_LIMITS_NS: Tuple[int, ...] = (5_000_000_000, 10_000_000_000, 15_000_000_000)
+    _TIME_BONUS: Tuple[int, ...] = (5, 3, 1, 0)
+
+    # Question files larger than this are streamed when ijson is available
+    _STREAM_THRESHOLD = 8 * 1024 * 1024
+
+    # Journaled questions are merged into the questions file once there are this many
+    _COMPACT_THRESHOLD = 50
+
     def __init__(self, questions_file: str = "questions.json"):
         """
         Initialize the quiz logic with the path to the questions file.
@@ -25,9 +109,16 @@ class QuizLogic:
             questions_file: Path to the JSON file containing questions
         """
         self.questions_file = questions_file
+        # Questions added by save_questions, one JSON object per line, until
+        # compact() merges them into the questions file
+        self._journal_file = questions_file + "l"
+        self._journal_lines = 0
         self.questions: List[Dict[str, Any]] = []
         self.current_questions: List[Dict[str, Any]] = []
-        self._remaining_questions: List[Dict[str, Any]] = []  # For pagination
+        # Questions are dealt from the front of the game's pool; the rest
+        # are kept for pagination
+        self._game_pool: List[Dict[str, Any]] = []
+        self._pool_used = 0
         self.current_question_index = 0
         self.score = 0
         self.difficulty = "all"
@@ -38,42 +129,273 @@ class QuizLogic:
         self.skipped_questions = 0
         self.used_hints = 0
         self.question_times: List[float] = []
+        # Running total of question_times, so the average is O(1)
+        self._time_sum = 0.0
+        # When each question of the game was first shown, by its index in
+        # current_questions, so the shared question dicts are never modified
+        # during play
+        self._start_times: Dict[int, int] = {}
         self.played_categories: Set[str] = set()
         self.completed_difficulties: Set[str] = set()
+        # Positions in self.questions by (category, difficulty), in order.
+        # Repeated question texts are dropped when a filter result is built.
+        self._by_category_difficulty: Dict[Tuple[str, str], List[int]] = {}
+        # filter_questions results by (difficulty, category), reset when the bank changes
+        self._filter_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        # Private copies of filter results to deal games from, kept between
+        # games by (difficulty, category) and reset when the bank changes
+        self._warm_pools: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        # Sorted choices offered by the GUI, refreshed when the bank changes
+        self._categories: List[str] = []
+        self._difficulties: List[str] = []
         self.load_questions()
 
     def load_questions(self) -> None:
         """
         Load questions from the JSON file.
 
+        The parsed bank is cached in a pickle file next to the JSON file and
+        reused until the JSON file changes. Questions added since the last
+        compaction are then read from the journal file.
+
         Handles file not found and JSON decode errors gracefully.
 
         Returns:
             None
         """
+        cache_file = self.questions_file + ".pkl"
         try:
-            with open(self.questions_file, 'r') as file:
-                data = json.load(file)
-                self.questions = data.get("questions", [])
-
-            # Add unique IDs to questions if they don't have them
-            for i, q in enumerate(self.questions):
-                if "id" not in q:
-                    q["id"] = f"q{i}"
-
-                # Add hints if they don't exist
-                if "hint" not in q:
-                    # Generate a basic hint based on the correct answer
-                    answer = q.get("correct_answer", "")
-                    if len(answer) > 3:
-                        q["hint"] = f"The answer starts with '{answer[0]}' and contains {len(answer)} letters."
-                    else:
-                        q["hint"] = "No hint available for this question."
-
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            # Read raw bytes; both parsers decode UTF-8 themselves, which
+            # skips the separate text-mode decoding pass
+            with open(self.questions_file, 'rb') as file:
+                st = os.fstat(file.fileno())
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._read_questions_cache(cache_file, stamp)
+                if cached is not None:
+                    self.questions = cached
+                elif ijson and st.st_size > self._STREAM_THRESHOLD:
+                    # Stream large banks so the raw file and the parsed
+                    # questions are never held in memory at the same time
+                    entries = ijson.items(file, "questions.item", use_float=True)
+                    self.questions = [self._prepare_question(i, q) for i, q in enumerate(entries)]
+                else:
+                    raw = file.read()
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
+                    self.questions = [self._prepare_question(i, q)
+                                      for i, q in enumerate(data.get("questions", []))]
+
+            if cached is None:
+                self._write_questions_cache(cache_file, stamp)
+
+        except (FileNotFoundError, json.JSONDecodeError, *_STREAM_ERRORS) as e:
             self.questions = []
             print(f"Error loading questions: {e}")
 
+        self._load_journal()
+        self._build_indexes()
+        self._cache_choices()
+
+    def _load_journal(self) -> None:
+        """
+        Append the questions recorded in the journal file to the bank.
+
+        Lines that can't be parsed, such as one cut short by a crash while
+        it was written, are skipped. So are questions already in the bank,
+        which a crash during compact() can leave behind in the journal.
+
+        Returns:
+            None
+        """
+        self._journal_lines = 0
+        try:
+            with open(self._journal_file, 'rb') as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return
+
+        loads = orjson.loads if orjson else json.loads
+        known = {self._journal_key(q) for q in self.questions}
+        for line in lines:
+            self._journal_lines += 1
+            try:
+                data = loads(line)
+            except json.JSONDecodeError as e:
+                print(f"Skipping unreadable journaled question: {e}")
+                continue
+            key = self._journal_key(data)
+            if key in known:
+                continue
+            known.add(key)
+            self.questions.append(self._prepare_question(len(self.questions), data))
+
+    @staticmethod
+    def _journal_key(question: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        """
+        Get what identifies a journaled question as already being in the bank.
+
+        Args:
+            question: The question
+
+        Returns:
+            Tuple of the question's text, category and difficulty
+        """
+        return question.get("question"), question.get("category"), question.get("difficulty")
+
+    @staticmethod
+    def _read_questions_cache(cache_file: str, stamp: Tuple[int, int]) -> Optional[List[Question]]:
+        """
+        Load the parsed question bank from its pickle cache.
+
+        Args:
+            cache_file: Path to the cache file
+            stamp: Modification time and size of the questions file
+
+        Returns:
+            The cached questions, or None if the cache is missing, unreadable
+            or was written for a different version of the questions file
+        """
+        try:
+            with open(cache_file, 'rb') as file:
+                cached_stamp, questions = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable questions cache: {e}")
+            return None
+        return questions if cached_stamp == stamp else None
+
+    def _write_questions_cache(self, cache_file: str, stamp: Tuple[int, int]) -> None:
+        """
+        Save the parsed question bank to its pickle cache.
+
+        The cache is only an optimization, so failures are reported and
+        otherwise ignored.
+
+        Args:
+            cache_file: Path to the cache file
+            stamp: Modification time and size of the questions file
+
+        Returns:
+            None
+        """
+        try:
+            with open(cache_file, 'wb') as file:
+                pickle.dump((stamp, self.questions), file, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Error saving questions cache: {e}")
+
+    def _prepare_question(self, index: int, data: Dict[str, Any]) -> Question:
+        """
+        Wrap a freshly parsed question, filling in a missing ID.
+
+        Args:
+            index: Position of the question in the bank
+            data: The question's fields
+
+        Returns:
+            The question
+        """
+        q = self._make_question(data)
+
+        # Add a unique ID if the question doesn't have one
+        if "id" not in q:
+            q["id"] = f"q{index}"
+
+        return q
+
+    @staticmethod
+    def _make_hint(question: Dict[str, Any]) -> str:
+        """
+        Generate a basic hint for a question that doesn't have one.
+
+        Hints are only generated when asked for, as most questions in a
+        large bank are never played.
+
+        Args:
+            question: The question to give a hint for
+
+        Returns:
+            Hint text based on the correct answer
+        """
+        answer = question.get("correct_answer", "")
+        if len(answer) > 3:
+            return f"The answer starts with '{answer[0]}' and contains {len(answer)} letters."
+        return "No hint available for this question."
+
+    @classmethod
+    def _make_question(cls, data: Dict[str, Any]) -> Question:
+        """
+        Wrap a question's data, working out its base points.
+
+        Args:
+            data: The question's fields
+
+        Returns:
+            The question
+        """
+        points = cls._POINTS.get(data.get("difficulty", "easy"), 10)
+        return Question(data, points)
+
+    def _cache_choices(self) -> None:
+        """
+        Cache the sorted categories and difficulties of the question bank.
+
+        Returns:
+            None
+        """
+        self._categories = sorted(set(q.get("category", "Uncategorized") for q in self.questions))
+        self._difficulties = sorted(set(q.get("difficulty", "easy") for q in self.questions))
+
+    @staticmethod
+    def _add_choice(choices: List[str], value: str) -> None:
+        """
+        Add a value to a sorted list of choices unless it's already there.
+
+        Args:
+            choices: Sorted choices, updated in place
+            value: Value to add
+
+        Returns:
+            None
+        """
+        i = bisect_left(choices, value)
+        if i == len(choices) or choices[i] != value:
+            choices.insert(i, value)
+
+    def _build_indexes(self) -> None:
+        """
+        Index the question bank by category and difficulty.
+
+        Returns:
+            None
+        """
+        self._by_category_difficulty = {}
+        self._filter_cache = {}
+        self._warm_pools = {}
+        for i, q in enumerate(self.questions):
+            self._index_question(i, q)
+
+    def _index_question(self, index: int, question: Dict[str, Any]) -> None:
+        """
+        Add a question to the category and difficulty indexes.
+
+        Args:
+            index: Position of the question in self.questions
+            question: The question to index
+
+        Returns:
+            None
+        """
+        # Share one string object per category and difficulty across the
+        # bank; index keys and comparisons then mostly hit identical objects
+        for field in ("category", "difficulty"):
+            value = question.get(field)
+            if isinstance(value, str):
+                question[field] = sys.intern(value)
+
+        key = (question.get("category", ""), question.get("difficulty", "easy"))
+        self._by_category_difficulty.setdefault(key, []).append(index)
+
     def filter_questions(self) -> List[Dict[str, Any]]:
         """
         Filter questions based on difficulty and category.
@@ -82,30 +404,40 @@ class QuizLogic:
         to filter the question bank. Also removes duplicates based
         on question text to ensure variety.
 
+        Results are cached until the question bank changes.
+
         Returns:
-            List of filtered questions matching the criteria
+            List of filtered questions matching the criteria. The list is
+            shared with later calls, so callers must not modify it.
         """
-        # Create a filtered iterator for better performance with large datasets
-        filtered_iter = iter(self.questions)
-
-        # Apply filters efficiently
-        if self.difficulty != "all":
-            filtered_iter = (q for q in filtered_iter if q.get("difficulty", "easy") == self.difficulty)
-
-        if self.category != "all":
-            filtered_iter = (q for q in filtered_iter if q.get("category", "") == self.category)
-
-        # Ensure no duplicate questions by checking question text
-        seen_questions: Set[str] = set()
-        unique_filtered: List[Dict[str, Any]] = []
-
-        # Process the iterator
-        for q in filtered_iter:
+        key = (self.difficulty, self.category)
+        cached = self._filter_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Combine the index lists matching the active filters instead of
+        # scanning the bank; there are only a few (category, difficulty) pairs
+        matches = [indices for (category, difficulty), indices in self._by_category_difficulty.items()
+                   if (self.category == "all" or category == self.category)
+                   and (self.difficulty == "all" or difficulty == self.difficulty)]
+        if len(matches) == 1:
+            indices = matches[0]
+        else:
+            # Each list is ascending, so sorting just merges them back into bank order
+            indices = sorted(chain.from_iterable(matches))
+
+        # Keep the first question with each text
+        questions = self.questions
+        seen_texts = set()
+        unique_filtered = []
+        for i in indices:
+            q = questions[i]
             q_text = q.get("question", "")
-            if q_text not in seen_questions:
-                seen_questions.add(q_text)
+            if q_text not in seen_texts:
+                seen_texts.add(q_text)
                 unique_filtered.append(q)
 
+        self._filter_cache[key] = unique_filtered
         return unique_filtered
 
     def start_new_game(self) -> bool:
@@ -119,23 +451,34 @@ class QuizLogic:
         Returns:
             True if game started successfully, False otherwise
         """
+        # Match the interned strings the indexes are keyed by, so lookups
+        # succeed on the identity check
+        self.difficulty = sys.intern(self.difficulty)
+        self.category = sys.intern(self.category)
+
         filtered_questions = self.filter_questions()
 
         if not filtered_questions:
             return False
 
-        # Shuffle and select questions for this game
-        random.shuffle(filtered_questions)
-
         # Implement pagination - only load a subset of questions initially
-        # to improve performance with large question sets
+        # to improve performance with large question sets. The rest are
+        # kept for potential pagination.
         max_questions = min(self.questions_per_game, len(filtered_questions))
-        self.current_questions = filtered_questions[:max_questions]
+
+        # Replays with the same filters deal from the pool left by the last
+        # game instead of copying the filtered list again. Any order of the
+        # pool is as good as another for dealing at random.
+        key = (self.difficulty, self.category)
+        pool = self._warm_pools.get(key)
+        if pool is None:
+            pool = self._warm_pools[key] = list(filtered_questions)
+        self._game_pool = pool
+        self._pool_used = 0
+        self.current_questions = self._deal(max_questions)
         self.current_question_index = 0
         self.score = 0
-
-        # Store remaining questions for potential pagination
-        self._remaining_questions = filtered_questions[max_questions:]
+        self._start_times = {}
 
         # Reset game statistics
         self.answered_correctly = 0
@@ -143,6 +486,7 @@ class QuizLogic:
         self.skipped_questions = 0
         self.used_hints = 0
         self.question_times = []
+        self._time_sum = 0.0
 
         # Record game start time
         self.game_start_time = time.time()
@@ -153,6 +497,24 @@ class QuizLogic:
 
         return True
 
+    def _deal(self, count: int) -> List[Dict[str, Any]]:
+        """
+        Deal questions at random from the part of the game's pool not yet used.
+
+        Only the dealt slots are shuffled, so this costs O(count) no matter
+        how large the pool is.
+
+        Args:
+            count: Number of questions to deal
+
+        Returns:
+            The dealt questions in random order
+        """
+        start = self._pool_used
+        _shuffle_prefix(self._game_pool, count, start)
+        self._pool_used = start + count
+        return self._game_pool[start:start + count]
+
     def get_current_question(self) -> Optional[Dict[str, Any]]:
         """
         Get the current question.
@@ -168,8 +530,8 @@ class QuizLogic:
             question = self.current_questions[self.current_question_index]
 
             # Record timestamp when the question is first accessed
-            if "start_time" not in question:
-                question["start_time"] = time.time()
+            if self.current_question_index not in self._start_times:
+                self._start_times[self.current_question_index] = time.monotonic_ns()
 
             return question
         return None
@@ -190,24 +552,28 @@ class QuizLogic:
         if not question:
             return []
 
-        options = question.get("options", []).copy()
+        options = list(question.get("options", []))
 
         # Ensure we always have at least 4 options for UI consistency
-        correct_answer = question.get("correct_answer", "")
         if len(options) < 4:
+            present = set(options)
+
             # Add the correct answer if it's not in options
-            if correct_answer and correct_answer not in options:
+            correct_answer = question.get("correct_answer", "")
+            if correct_answer and correct_answer not in present:
                 options.append(correct_answer)
+                present.add(correct_answer)
 
             # Add dummy options if still needed
             dummy_options = ["Option A", "Option B", "Option C", "Option D"]
             for opt in dummy_options:
                 if len(options) >= 4:
                     break
-                if opt not in options:
+                if opt not in present:
                     options.append(opt)
+                    present.add(opt)
 
-        random.shuffle(options)
+        _shuffle_prefix(options, len(options))
         return options
 
     def check_answer(self, selected_option: str) -> bool:
@@ -228,39 +594,61 @@ class QuizLogic:
         if not question:
             return False
 
-        # Record the answer time
-        question["answer_time"] = time.time()
-        time_taken = question["answer_time"] - question.get("start_time", question["answer_time"])
-        self.question_times.append(time_taken)
+        time_taken_ns = self._record_answer_time()
 
         is_correct = selected_option == question.get("correct_answer")
 
         if is_correct:
             self.answered_correctly += 1
 
-            # Award points based on difficulty
-            difficulty = question.get("difficulty", "easy")
-            points = {"easy": 10, "medium": 15, "hard": 20}.get(difficulty, 10)
+            # Award points based on difficulty, worked out when the question was loaded
+            points = question.points
 
             # Add time bonus for quick answers (max 5 points)
-            time_bonus = 0
-            if time_taken < 5:
-                time_bonus = 5
-            elif time_taken < 10:
-                time_bonus = 3
-            elif time_taken < 15:
-                time_bonus = 1
+            time_bonus = self._TIME_BONUS[bisect_right(self._TIME_BONUS_LIMITS_NS, time_taken_ns)]
 
             self.score += points + time_bonus
-
-            # Store the points awarded for this question
-            question["points_awarded"] = points + time_bonus
         else:
             self.answered_incorrectly += 1
-            question["points_awarded"] = 0
 
         return is_correct
 
+    @classmethod
+    def score_answers(cls, answers: Iterable[Tuple[str, float, bool]]) -> int:
+        """
+        Score a batch of recorded answers, e.g. when replaying a game log.
+
+        Uses the same base points and time bonus as check_answer.
+
+        Args:
+            answers: (difficulty, seconds taken, answered correctly) per answer
+
+        Returns:
+            Total points for the batch
+        """
+        points = cls._POINTS
+        limits = cls._TIME_BONUS_LIMITS_NS
+        bonus = cls._TIME_BONUS
+        total = 0
+        for difficulty, time_taken, correct in answers:
+            if correct:
+                total += points.get(difficulty, 10) + bonus[bisect_right(limits, time_taken * 1e9)]
+        return total
+
+    def _record_answer_time(self) -> int:
+        """
+        Record how long the current question took to answer.
+
+        Returns:
+            Nanoseconds since the question was first shown
+        """
+        start_time = self._start_times.get(self.current_question_index)
+        time_taken_ns = time.monotonic_ns() - start_time if start_time is not None else 0
+        time_taken = time_taken_ns / 1e9
+        self.question_times.append(time_taken)
+        self._time_sum += time_taken
+        return time_taken_ns
+
     def next_question(self) -> bool:
         """
         Move to the next question.
@@ -285,16 +673,16 @@ class QuizLogic:
         # Check if we've reached the end of the current batch
         if self.current_question_index >= len(self.current_questions):
             # If we have more questions available, load the next batch
-            if self._remaining_questions:
+            questions_left = len(self._game_pool) - self._pool_used
+            if questions_left > 0:
                 # Calculate how many more questions we can add without exceeding the limit
                 questions_remaining = self.questions_per_game - total_answered
                 if questions_remaining <= 0:
                     return False
                     
                 # Load up to 5 more questions (pagination), but not exceeding user limit
-                batch_size = min(5, len(self._remaining_questions), questions_remaining)
-                next_batch = self._remaining_questions[:batch_size]
-                self._remaining_questions = self._remaining_questions[batch_size:]
+                batch_size = min(5, questions_left, questions_remaining)
+                next_batch = self._deal(batch_size)
 
                 # Add to current questions
                 self.current_questions.extend(next_batch)
@@ -325,6 +713,20 @@ class QuizLogic:
         """
         self.skipped_questions += 1
 
+    def expire_question(self) -> None:
+        """
+        Record that the timer ran out on the current question.
+
+        Counts the question as skipped, awards no points and records the
+        time spent on it for the statistics.
+
+        Returns:
+            None
+        """
+        self.skipped_questions += 1
+        if self.get_current_question():
+            self._record_answer_time()
+
     def use_hint(self) -> str:
         """
         Use a hint for the current question.
@@ -338,32 +740,32 @@ class QuizLogic:
 
         question = self.get_current_question()
         if question:
-            return question.get("hint", "No hint available for this question.")
+            return question["hint"] if "hint" in question else self._make_hint(question)
         return "No question available."
 
     def get_available_categories(self) -> List[str]:
         """
         Get a list of all available categories.
 
-        Extracts unique categories from the question bank and sorts them.
+        Categories are collected and sorted when the question bank is
+        loaded or changed.
 
         Returns:
             List of unique categories
         """
-        categories = set(q.get("category", "Uncategorized") for q in self.questions)
-        return sorted(list(categories))
+        return list(self._categories)
 
     def get_available_difficulties(self) -> List[str]:
         """
         Get a list of all available difficulties.
 
-        Extracts unique difficulty levels from the question bank and sorts them.
+        Difficulties are collected and sorted when the question bank is
+        loaded or changed.
 
         Returns:
             List of unique difficulties
         """
-        difficulties = set(q.get("difficulty", "easy") for q in self.questions)
-        return sorted(list(difficulties))
+        return list(self._difficulties)
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -376,7 +778,7 @@ class QuizLogic:
         """
         total_answered = self.answered_correctly + self.answered_incorrectly
         accuracy = (self.answered_correctly / total_answered * 100) if total_answered > 0 else 0
-        avg_time = sum(self.question_times) / len(self.question_times) if self.question_times else 0
+        avg_time = self._time_sum / len(self.question_times) if self.question_times else 0
 
         return {
             "score": self.score,
@@ -410,13 +812,59 @@ class QuizLogic:
             return False
 
         # Add the question to the bank
+        new_question = self._make_question(new_question)
         self.questions.append(new_question)
+        self._index_question(len(self.questions) - 1, new_question)
+        self._filter_cache.clear()
+        self._warm_pools.clear()
+        self._add_choice(self._categories, new_question.get("category", "Uncategorized"))
+        self._add_choice(self._difficulties, new_question.get("difficulty", "easy"))
 
         try:
-            # Save the updated question bank
-            with open(self.questions_file, 'w') as file:
-                json.dump({"questions": self.questions}, file, indent=2)
-            return True
+            # Append to the journal instead of rewriting the whole bank
+            if orjson:
+                with open(self._journal_file, 'ab') as file:
+                    file.write(orjson.dumps(new_question) + b"\n")
+            else:
+                with open(self._journal_file, 'a') as file:
+                    file.write(json.dumps(new_question) + "\n")
+            self._journal_lines += 1
         except Exception as e:
             print(f"Error saving question: {e}")
             return False
+
+        if self._journal_lines >= self._COMPACT_THRESHOLD:
+            self.compact()
+        return True
+
+    def compact(self) -> bool:
+        """
+        Merge the journaled questions into the questions file.
+
+        The questions file is replaced atomically and the journal is removed
+        afterwards. A crash in between leaves the merged questions in the
+        journal as well, and loading skips them there.
+
+        Returns:
+            True if the questions file is up to date, False otherwise
+        """
+        if not self._journal_lines:
+            return True
+
+        tmp_file = self.questions_file + ".tmp"
+        try:
+            data = {"questions": self.questions}
+            if orjson:
+                with open(tmp_file, 'wb') as file:
+                    file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w') as file:
+                    json.dump(data, file, indent=2)
+            os.replace(tmp_file, self.questions_file)
+            if os.path.exists(self._journal_file):
+                os.remove(self._journal_file)
+            self._journal_lines = 0
+            return True
+        except Exception as e:
+            print(f"Error compacting questions: {e}")
+            return False
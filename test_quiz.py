@@ -2,10 +2,27 @@ import unittest
 import os
 import json
 from quiz_logic import QuizLogic
+import high_scores
 from high_scores import HighScores
+import localization
+from localization import Localization
 import tkinter as tk
 import customtkinter as ctk
 from gui import QuizApp
+from unittest import mock
+
+
+def sample_question(**overrides):
+    """Return a new easy Math question, with any fields overridden."""
+    question = {
+        "question": "What is 3+3?",
+        "options": ["5", "6", "7", "8"],
+        "correct_answer": "6",
+        "difficulty": "easy",
+        "category": "Math"
+    }
+    question.update(overrides)
+    return question
 
 
 class TestQuizLogic(unittest.TestCase):
@@ -64,14 +81,65 @@ class TestQuizLogic(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after tests."""
-        if os.path.exists(self.test_questions_file):
-            os.remove(self.test_questions_file)
+        for path in (self.test_questions_file, self.test_questions_file + ".pkl",
+                     self.test_questions_file + "l"):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_load_questions(self):
         """Test loading questions from file."""
         self.assertEqual(len(self.quiz_logic.questions), 5)
         self.assertEqual(self.quiz_logic.questions[0]["question"], "What is 2+2?")
 
+    def test_questions_cache(self):
+        """Test that the parsed bank is cached until the questions file changes."""
+        cache_file = self.test_questions_file + ".pkl"
+        self.assertTrue(os.path.exists(cache_file))
+
+        cached = QuizLogic(self.test_questions_file)
+        self.assertEqual(cached.questions, self.quiz_logic.questions)
+        self.assertEqual([q.points for q in cached.questions],
+                         [q.points for q in self.quiz_logic.questions])
+
+        self.quiz_logic.save_questions(sample_question())
+        self.assertEqual(len(QuizLogic(self.test_questions_file).questions), 6)
+
+    def test_saved_questions_are_compacted(self):
+        """Test that saved questions are journaled, then merged into the file."""
+        journal_file = self.test_questions_file + "l"
+        for i in range(3):
+            self.assertTrue(self.quiz_logic.save_questions(
+                sample_question(question=f"Sample question {i}?")))
+        self.assertTrue(os.path.exists(journal_file))
+        self.assertEqual(len(QuizLogic(self.test_questions_file).questions), 8)
+
+        self.assertTrue(self.quiz_logic.compact())
+        self.assertFalse(os.path.exists(journal_file))
+        with open(self.test_questions_file) as f:
+            self.assertEqual(len(json.load(f)["questions"]), 8)
+        self.assertEqual(len(QuizLogic(self.test_questions_file).questions), 8)
+
+    def test_interrupted_compaction_is_not_reloaded_twice(self):
+        """Test that questions left in the journal after merging load only once."""
+        journal_file = self.test_questions_file + "l"
+        self.quiz_logic.save_questions(sample_question())
+        with open(journal_file) as f:
+            journal = f.read()
+
+        # Simulate a crash after the questions file was replaced
+        self.quiz_logic.compact()
+        with open(journal_file, "w") as f:
+            f.write(journal)
+
+        self.assertEqual(len(QuizLogic(self.test_questions_file).questions), 6)
+
+    def test_question_points(self):
+        """Test that base points are worked out per question at load time."""
+        points = {q["question"]: q.points for q in self.quiz_logic.questions}
+        self.assertEqual(points["What is 2+2?"], 10)
+        self.assertEqual(points["Which is the largest planet?"], 15)
+        self.assertEqual(points["What is the square root of 144?"], 20)
+
     def test_filter_questions_by_difficulty(self):
         """Test filtering questions by difficulty."""
         self.quiz_logic.difficulty = "easy"
@@ -88,6 +156,24 @@ class TestQuizLogic(unittest.TestCase):
         self.assertEqual(filtered[0]["category"], "Math")
         self.assertEqual(filtered[1]["category"], "Math")
 
+    def test_filter_questions_by_category_and_difficulty(self):
+        """Test filtering questions by category and difficulty together."""
+        self.quiz_logic.category = "Math"
+        self.quiz_logic.difficulty = "hard"
+        filtered = self.quiz_logic.filter_questions()
+        self.assertEqual([q["question"] for q in filtered], ["What is the square root of 144?"])
+
+        self.quiz_logic.category = "Science"
+        self.assertEqual(self.quiz_logic.filter_questions(), [])
+
+    def test_filter_questions_after_save(self):
+        """Test that cached filter results pick up newly saved questions."""
+        self.quiz_logic.category = "Math"
+        self.assertEqual(len(self.quiz_logic.filter_questions()), 2)
+
+        self.quiz_logic.save_questions(sample_question())
+        self.assertEqual(len(self.quiz_logic.filter_questions()), 3)
+
     def test_start_new_game(self):
         """Test starting a new game."""
         result = self.quiz_logic.start_new_game()
@@ -96,6 +182,86 @@ class TestQuizLogic(unittest.TestCase):
         self.assertEqual(self.quiz_logic.current_question_index, 0)
         self.assertEqual(self.quiz_logic.score, 0)
 
+    def test_start_new_game_keeps_bank_order(self):
+        """Test that starting a game does not reorder the question bank."""
+        before = [q["question"] for q in self.quiz_logic.questions]
+        unfiltered = [q["question"] for q in self.quiz_logic.filter_questions()]
+        self.quiz_logic.start_new_game()
+
+        self.assertEqual([q["question"] for q in self.quiz_logic.questions], before)
+        self.assertEqual([q["question"] for q in self.quiz_logic.filter_questions()], unfiltered)
+
+    def test_use_hint_generates_missing_hint(self):
+        """Test that questions without a hint get one generated when asked."""
+        self.quiz_logic.category = "Geography"
+        self.quiz_logic.start_new_game()
+
+        self.assertEqual(self.quiz_logic.use_hint(),
+                         "The answer starts with 'P' and contains 5 letters.")
+        self.assertEqual(self.quiz_logic.used_hints, 1)
+        self.assertNotIn("hint", self.quiz_logic.get_current_question())
+
+    def test_time_bonus(self):
+        """Test that slower correct answers earn a smaller time bonus."""
+        self.quiz_logic.start_new_game()
+
+        # The question is shown at t=0 and answered seven seconds later
+        with mock.patch("time.monotonic_ns", side_effect=[0, 7_000_000_000]):
+            question = self.quiz_logic.get_current_question()
+            self.quiz_logic.check_answer(question["correct_answer"])
+        self.assertEqual(self.quiz_logic.score, question.points + 3)
+
+    def test_score_answers(self):
+        """Test scoring a batch of recorded answers."""
+        answers = [
+            ("easy", 2.0, True),      # 10 + 5
+            ("medium", 7.5, True),    # 15 + 3
+            ("hard", 12.0, True),     # 20 + 1
+            ("hard", 30.0, True),     # 20
+            ("medium", 1.0, False),   # 0
+        ]
+        self.assertEqual(QuizLogic.score_answers(answers), 74)
+        self.assertEqual(QuizLogic.score_answers([]), 0)
+
+    def test_play_leaves_questions_unchanged(self):
+        """Test that timing and scoring are kept out of the question bank."""
+        before = [dict(q) for q in self.quiz_logic.questions]
+        self.quiz_logic.start_new_game()
+
+        question = self.quiz_logic.get_current_question()
+        self.assertTrue(self.quiz_logic.check_answer(question["correct_answer"]))
+        self.quiz_logic.next_question()
+        self.quiz_logic.get_current_question()
+        self.quiz_logic.expire_question()
+
+        self.assertEqual(len(self.quiz_logic.question_times), 2)
+        self.assertEqual(self.quiz_logic.skipped_questions, 1)
+        self.assertEqual([dict(q) for q in self.quiz_logic.questions], before)
+
+    def test_replay_deals_from_warm_pool(self):
+        """Test that replays deal fresh games until the bank changes."""
+        bank = {q["question"] for q in self.quiz_logic.questions}
+        self.quiz_logic.questions_per_game = 3
+        for _ in range(2):
+            self.assertTrue(self.quiz_logic.start_new_game())
+            dealt = {q["question"] for q in self.quiz_logic.current_questions}
+            self.assertEqual(len(dealt), 3)
+            self.assertTrue(dealt <= bank)
+
+        self.quiz_logic.save_questions(sample_question())
+        self.quiz_logic.questions_per_game = 10
+        self.quiz_logic.start_new_game()
+        dealt = {q["question"] for q in self.quiz_logic.current_questions}
+        self.assertEqual(dealt, bank | {"What is 3+3?"})
+
+    def test_current_questions_set_directly(self):
+        """Test playing questions assigned without start_new_game."""
+        self.quiz_logic.current_questions = list(self.quiz_logic.questions[:2])
+        question = self.quiz_logic.get_current_question()
+        self.assertEqual(question["question"], "What is 2+2?")
+        self.assertTrue(self.quiz_logic.check_answer("4"))
+        self.assertEqual(len(self.quiz_logic.question_times), 1)
+
     def test_get_current_question(self):
         """Test getting the current question."""
         self.quiz_logic.start_new_game()
@@ -154,6 +320,14 @@ class TestQuizLogic(unittest.TestCase):
         expected_categories = ["Math", "Geography", "Science", "Literature"]
         self.assertListEqual(sorted(categories), sorted(expected_categories))
 
+    def test_available_categories_after_save(self):
+        """Test that saved questions add their category in sorted order."""
+        self.quiz_logic.save_questions(sample_question(category="Art"))
+        self.assertListEqual(self.quiz_logic.get_available_categories(),
+                             ["Art", "Geography", "Literature", "Math", "Science"])
+        self.assertListEqual(self.quiz_logic.get_available_difficulties(),
+                             ["easy", "hard", "medium"])
+
     def test_get_available_difficulties(self):
         """Test getting available difficulties."""
         difficulties = self.quiz_logic.get_available_difficulties()
@@ -193,6 +367,9 @@ class TestHighScores(unittest.TestCase):
         
     def tearDown(self):
         """Clean up after tests."""
+        # Drop the instance so the exit hook doesn't write its stats after
+        # the files are removed
+        self.high_scores = None
         if os.path.exists(self.test_scores_file):
             os.remove(self.test_scores_file)
         if os.path.exists(self.test_stats_file):
@@ -232,6 +409,116 @@ class TestHighScores(unittest.TestCase):
         self.assertTrue(self.high_scores.is_high_score(101))   # Just above lowest
         self.assertTrue(self.high_scores.is_high_score(600))   # Above highest
 
+    def test_get_top_scores_filtered(self):
+        """Test that filtered top scores keep descending order."""
+        self.high_scores.save_score("Player1", 100, {"category": "Math", "difficulty": "easy"})
+        self.high_scores.save_score("Player2", 300, {"category": "Science", "difficulty": "easy"})
+        self.high_scores.save_score("Player3", 200, {"category": "Math", "difficulty": "hard"})
+        
+        top_scores = self.high_scores.get_top_scores(category="Math")
+        self.assertEqual([s[0] for s in top_scores], ["Player3", "Player1"])
+        
+        top_scores = self.high_scores.get_top_scores(difficulty="easy")
+        self.assertEqual([s[0] for s in top_scores], ["Player2", "Player1"])
+
+    def test_is_high_score_filtered(self):
+        """Test the high score check against a category's own top five."""
+        for i in range(5):
+            self.high_scores.save_score(f"Player{i}", (i+1)*100, {"category": "Math"})
+        self.high_scores.save_score("Other", 10, {"category": "Science"})
+
+        self.assertFalse(self.high_scores.is_high_score(100, category="Math"))
+        self.assertTrue(self.high_scores.is_high_score(101, category="Math"))
+        self.assertTrue(self.high_scores.is_high_score(1, category="Science"))
+
+    def test_scores_are_bounded(self):
+        """Test that only the best max_scores entries are kept and saved."""
+        high_scores = HighScores(self.test_scores_file, self.test_stats_file, max_scores=3)
+        for i in range(5):
+            high_scores.save_score(f"Player{i}", (i+1)*100)
+        
+        self.assertEqual([s[1] for s in high_scores.scores], [500, 400, 300])
+        
+        # Reloading keeps only the retained entries
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file, max_scores=3)
+        self.assertEqual([s[1] for s in reloaded.scores], [500, 400, 300])
+
+    def test_scores_are_bounded_per_view(self):
+        """Test that a full overall list doesn't push out category scores."""
+        high_scores = HighScores(self.test_scores_file, self.test_stats_file, max_scores=5)
+        for i in range(5):
+            high_scores.save_score(f"Player{i}", 100 + i)
+
+        self.assertTrue(high_scores.is_high_score(50, "Science", "easy"))
+        high_scores.save_score("x", 50, {"category": "Science", "difficulty": "easy"})
+        self.assertEqual([s[0] for s in high_scores.get_top_scores(5, "Science", "easy")], ["x"])
+
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file, max_scores=5)
+        self.assertEqual([s[0] for s in reloaded.get_top_scores(5, "Science", "easy")], ["x"])
+        self.assertEqual(len(reloaded.scores), 5)
+
+    def test_save_score_keeps_order(self):
+        """Test that new scores are inserted in place, with ties ranked by age."""
+        for name, score in [("A", 100), ("B", 300), ("C", 200), ("D", 200), ("E", 50)]:
+            self.high_scores.save_score(name, score)
+
+        self.assertEqual([s[0] for s in self.high_scores.scores], ["B", "C", "D", "A", "E"])
+
+    def test_load_scores_formats(self):
+        """Test loading legacy and extended lines while skipping malformed ones."""
+        with open(self.test_scores_file, "w") as f:
+            f.write("Alice,120\n")
+            f.write("Bob,250,2024-01-01 10:00,Math,hard\n")
+            f.write("garbage line\n")
+            f.write("Carol,abc\n")
+            f.write("Dave,5\u00b2,2024-01-01 10:00,Math,hard\n")
+        
+        self.high_scores.load_scores()
+        self.assertEqual(len(self.high_scores.scores), 2)
+        self.assertEqual(self.high_scores.scores[0], ("Bob", 250, "2024-01-01 10:00", "Math", "hard"))
+        self.assertEqual(self.high_scores.scores[1], ("Alice", 120, "Unknown", "all", "all"))
+
+    def test_name_with_quote_survives_reload(self):
+        """Test that a name starting with a quote doesn't swallow later lines."""
+        self.high_scores.save_score('"Bob', 300)
+        self.high_scores.save_score("Alice", 200)
+        self.high_scores.save_score("Carol", 100)
+
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file)
+        self.assertEqual([(name, score) for name, score, *_ in reloaded.scores],
+                         [('"Bob', 300), ("Alice", 200), ("Carol", 100)])
+
+    def test_save_score_replaces_file(self):
+        """Test that saving leaves only the complete scores file behind."""
+        self.high_scores.save_score("Player1", 100)
+
+        self.assertTrue(os.path.exists(self.test_scores_file))
+        self.assertFalse(os.path.exists(self.test_scores_file + ".tmp"))
+        with open(self.test_scores_file) as f:
+            self.assertTrue(f.read().startswith("Player1,100,"))
+
+    def test_scores_file_is_compacted(self):
+        """Test that appended lines are compacted once stale lines pile up."""
+        high_scores = HighScores(self.test_scores_file, self.test_stats_file, max_scores=2)
+        for i in range(6):
+            high_scores.save_score(f"Player{i}", (i+1)*100)
+
+        with open(self.test_scores_file) as f:
+            lines = f.read().splitlines()
+        self.assertLessEqual(len(lines), 2 * len(high_scores.scores))
+
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file, max_scores=2)
+        self.assertEqual([s[1] for s in reloaded.scores], [600, 500])
+
+    def test_ensure_loaded_keeps_memory(self):
+        """Test that ensure_loaded does not re-read scores already in memory."""
+        self.high_scores.save_score("Player1", 100)
+        with open(self.test_scores_file, "w") as f:
+            f.write("Other,999\n")
+
+        self.high_scores.ensure_loaded()
+        self.assertEqual(self.high_scores.get_top_scores()[0][0], "Player1")
+
     def test_player_stats(self):
         """Test updating and retrieving player statistics."""
         # Save a score with stats
@@ -252,6 +539,87 @@ class TestHighScores(unittest.TestCase):
         self.assertEqual(player_stats["correct_answers"], 8)
 
 
+    def test_stats_saved_on_flush(self):
+        """Test that player stats are written out by flush_stats, not on every score."""
+        self.high_scores.save_score("Player1", 100)
+        self.assertFalse(os.path.exists(self.test_stats_file))
+
+        self.high_scores.flush_stats()
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file)
+        self.assertEqual(reloaded.get_player_stats("Player1")["highest_score"], 100)
+
+    def test_stats_saved_at_exit(self):
+        """Test that the exit hook writes out unsaved player stats."""
+        self.high_scores.save_score("Player2", 120)
+        self.assertFalse(os.path.exists(self.test_stats_file))
+
+        high_scores._flush_stats_at_exit()
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file)
+        self.assertEqual(reloaded.get_player_stats("Player2")["highest_score"], 120)
+
+    def test_malformed_stats_file(self):
+        """Test that a stats file with a bad metric value falls back to empty stats."""
+        with open(self.test_stats_file, "w") as f:
+            json.dump({"bob": {"games_played": "oops", "highest_score": 10}}, f)
+
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file)
+        self.assertEqual(reloaded.player_stats, {})
+        self.assertEqual(reloaded.get_leaderboard(), [])
+
+    def test_categories_played_are_unique(self):
+        """Test that repeated categories are recorded once and survive a reload."""
+        stats = {"category": "Math", "difficulty": "easy"}
+        self.high_scores.save_score("Player1", 100, stats)
+        self.high_scores.save_score("Player1", 120, stats)
+        self.assertEqual(self.high_scores.get_player_stats("Player1")["categories_played"], {"Math"})
+
+        self.high_scores.flush_stats()
+        reloaded = HighScores(self.test_scores_file, self.test_stats_file)
+        self.assertEqual(reloaded.get_player_stats("Player1")["categories_played"], {"Math"})
+
+    def test_leaderboard_updates_after_save(self):
+        """Test that a cached leaderboard is refreshed when stats change."""
+        self.high_scores.save_score("Player1", 100)
+        self.assertEqual(self.high_scores.get_leaderboard(), [("Player1", 100)])
+
+        self.high_scores.save_score("Player2", 200)
+        self.assertEqual(self.high_scores.get_leaderboard(), [("Player2", 200), ("Player1", 100)])
+
+
+class TestLocalization(unittest.TestCase):
+    """Test cases for the Localization class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Start each test with only the English table loaded
+        localization._TRANSLATIONS.pop("ar", None)
+        self.localization = Localization()
+
+    def test_arabic_loaded_on_selection(self):
+        """Test that Arabic translations are only loaded once Arabic is selected."""
+        self.assertNotIn("ar", localization._TRANSLATIONS)
+
+        self.assertTrue(self.localization.change_language("ar"))
+        self.assertIn("ar", localization._TRANSLATIONS)
+
+    def test_get_text_follows_language(self):
+        """Test that get_text uses the language picked by change_language."""
+        english = self.localization.get_text("app_title")
+        self.assertEqual(english, "Quiz Master")
+
+        self.localization.change_language("ar")
+        self.assertNotEqual(self.localization.get_text("app_title"), english)
+
+        self.localization.change_language("en")
+        self.assertEqual(self.localization.get_text("app_title"), english)
+
+    def test_unknown_key_falls_back_to_key(self):
+        """Test that keys without a translation are returned unchanged."""
+        self.assertEqual(self.localization.get_text("no_such_key"), "no_such_key")
+        self.localization.change_language("ar")
+        self.assertEqual(self.localization.get_text("no_such_key"), "no_such_key")
+
+
 class TestGUI(unittest.TestCase):
     """Basic test cases for GUI functionality."""
     
@@ -291,8 +659,10 @@ class TestGUI(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
-        if os.path.exists(self.test_questions_file):
-            os.remove(self.test_questions_file)
+        for path in (self.test_questions_file, self.test_questions_file + ".pkl",
+                     self.test_questions_file + "l"):
+            if os.path.exists(path):
+                os.remove(path)
         if os.path.exists(self.test_scores_file):
             os.remove(self.test_scores_file)
     
@@ -306,6 +676,15 @@ class TestGUI(unittest.TestCase):
         except Exception as e:
             self.fail(f"GUI initialization failed: {e}")
 
+    def test_high_scores_screen(self):
+        """Test that the high scores screen can be built and shown."""
+        try:
+            app = QuizApp(TestGUI.root)
+            app.show_high_scores_screen()
+            self.assertTrue(app.root.winfo_children())
+        except Exception as e:
+            self.fail(f"High scores screen failed: {e}")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file